@@ -3,59 +3,84 @@ HablaConmigo - Spanish Learning App
 Main Gradio application
 """
 
-import gradio as gr
+import atexit
+import functools
 import tempfile
 import os
+
+# Keep temp audio (recordings, TTS clips) on a RAM-backed tmpfs when there is
+# one (Linux). Must run before gradio and src.audio read the temp directory.
+if os.path.isdir("/dev/shm"):
+    _ram_tmp = "/dev/shm/hablaconmigo"
+    os.makedirs(_ram_tmp, exist_ok=True)
+    tempfile.tempdir = _ram_tmp
+    os.environ.setdefault("GRADIO_TEMP_DIR", os.path.join(_ram_tmp, "gradio"))
+
+import gradio as gr
+import random
+import re
+import unicodedata
+import threading
+import time
+from collections import OrderedDict, deque
+from datetime import datetime, timedelta
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from dotenv import load_dotenv
+from rapidfuzz import fuzz
 
 # Load environment variables from .env file
 load_dotenv()
 
 from src.audio import (
     text_to_speech,
-    transcribe_audio,
+    text_to_speech_async,
+    transcribe_audio_from_array,
+    new_transcription_stream,
+    feed_transcription_stream,
+    finish_transcription_stream,
     compare_pronunciation,
     get_whisper_model,
-    SPANISH_VOICES
+    warm_up_audio,
+    SPANISH_VOICES,
+    TTS_CACHE_DIR,
+    TTS_BAKED_DIR,
+    WHISPER_BATCH_SIZE,
+    sweep_tts_cache
 )
 from src.llm import (
-    chat,
-    get_pronunciation_feedback,
+    chat_stream,
+    get_pronunciation_feedback_stream,
     explain_grammar,
     get_vocabulary_help,
     get_available_models,
     translate_to_english,
     suggest_response,
     generate_memory_sentence,
+    warm_up_models,
     DEFAULT_MODEL,
-    FAST_MODEL
+    FAST_MODEL,
+    WORD_ANALYSIS_WORKERS
 )
-from src.images import get_memory_image, is_imageable
 from src.database import (
     init_database,
     get_phrases,
     get_all_vocabulary,
     get_vocabulary_for_review,
     get_vocabulary_by_id,
-    get_vocabulary_by_status,
-    count_vocabulary_by_status,
-    get_vocabulary_pipeline_stats,
+    get_vocabulary_by_status_with_count,
+    get_home_snapshot,
     update_vocabulary_progress,
+    update_and_next,
     record_pronunciation_attempt,
     get_statistics,
-    start_session,
-    end_session,
-    get_sections,
-    get_units,
-    get_user_progress,
-    get_vocabulary_stats,
+    get_learning_path,
     get_recommended_activities,
-    get_daily_goal_progress,
     get_xp_for_level,
     introduce_new_words,
     get_connection,
-    add_practice_time,
+    get_data_version,
+    flush_practice_events,
     reset_practice_time,
     save_content_package,
     add_package_vocabulary,
@@ -94,178 +119,460 @@ init_database()
 populate_database()
 init_dele_topics()  # Initialize DELE topics
 
+# Phrases are static content written by populate_database(), so keep them in
+# memory instead of running an ORDER BY RANDOM() query on every click
+PHRASES_BY_CATEGORY = {}
 
-# Preload Whisper model at startup to avoid timeout during first request
-print("Preloading Whisper model (this may take a minute on first run)...")
-get_whisper_model()
-print("Whisper model loaded!")
 
-# Global state
-current_phrase = None
-conversation_history = []
-current_session_id = None
-practice_stats = {"attempts": 0, "total_accuracy": 0}
+def reload_phrases():
+    """(Re)load all phrases into PHRASES_BY_CATEGORY - call after changing phrase content"""
+    global PHRASES_BY_CATEGORY
+    by_category = {'all': get_phrases()}
+    for phrase in by_category['all']:
+        by_category.setdefault(phrase['category'], []).append(phrase)
+    PHRASES_BY_CATEGORY = by_category
 
-# Smart session tracking - based on interaction gaps
-from datetime import datetime, timedelta
 
+def pick_phrases(category: str = "all", count: int = 1) -> list:
+    """Pick up to count distinct random phrases from a category"""
+    phrases = PHRASES_BY_CATEGORY.get(category, [])
+    return random.sample(phrases, min(count, len(phrases)))
+
+
+reload_phrases()
+
+
+_prerender_lock = threading.Lock()
+
+
+def prerender_audio():
+    """Synthesize every phrase and vocabulary word into the TTS disk cache.
+
+    Runs once per content set (the marker file name includes the phrase and
+    word counts), so after the first start every Listen click is a file read.
+    """
+    with _prerender_lock:
+        _prerender_audio()
+
+
+def schedule_prerender():
+    """Render audio for newly added content in the background"""
+    threading.Thread(target=prerender_audio, daemon=True).start()
+
+
+def _prerender_audio():
+    phrases = PHRASES_BY_CATEGORY['all']
+    vocab = get_all_vocabulary()
+    marker = TTS_CACHE_DIR / f"__warmed_{len(phrases)}_{len(vocab)}"
+    if marker.exists():
+        return
+
+    items = [(p['spanish'], voice) for p in phrases for voice in ("female", "male")]
+    items += [(w['spanish'], "female") for w in vocab]
+
+    def render(item):
+        try:
+            text_to_speech(*item)
+            return True
+        except Exception:
+            return False
+
+    with ThreadPoolExecutor(max_workers=16, thread_name_prefix="prerender") as pool:
+        rendered = sum(pool.map(render, items))
+
+    print(f"Pre-rendered audio: {rendered}/{len(items)} clips cached")
+    if rendered == len(items):
+        # With every clip baked into data/tts nothing was written to the
+        # cache, so its directory may not exist yet
+        TTS_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        marker.touch()
+
+
+# Trim old clips, then render in the background so startup isn't blocked on
+# hundreds of TTS calls
+sweep_tts_cache()
+schedule_prerender()
+
+
+def preload_models():
+    """Load Whisper and the everyday LLMs so the first click on any tab isn't slow"""
+    print("Preloading Whisper model (this may take a minute on first run)...")
+    get_whisper_model()
+    warm_up_audio()  # Prime transcription + TTS
+    print("Whisper model loaded!")
+    warm_up_models()  # Conversation + feedback models into Ollama's memory
+
+
+# Warm up in the background so the UI comes up immediately; a transcription
+# that arrives first simply waits on the model lock in get_whisper_model()
+threading.Thread(target=preload_models, daemon=True).start()
+
+# Smart session tracking - based on interaction gaps
 SESSION_TIMEOUT_MINUTES = 3  # Gap threshold for session timeout
 last_interaction_time = None
 session_items = 0
 session_total_accuracy = 0.0
+_session_lock = threading.Lock()  # Handlers run on several worker threads
+
+# Practice activities are written in batches rather than 3 writes per answer
+PRACTICE_FLUSH_EVENTS = 20
+PRACTICE_FLUSH_SECONDS = 30
+_pending_practice_events = []  # (practice_seconds, accuracy, occurred_at)
+_last_practice_flush = time.monotonic()
 
 
 def record_practice_activity(accuracy: float):
     """Record a practice activity with smart time tracking.
 
     Only counts time if the gap since last interaction is < 3 minutes.
+    Activities are buffered and saved by flush_practice_activity(), here
+    once PRACTICE_FLUSH_EVENTS are waiting or by the background flusher.
     """
     global last_interaction_time, session_items, session_total_accuracy
 
-    now = datetime.now()
-    time_to_add = 0
+    with _session_lock:
+        now = datetime.now()
+        time_to_add = 0
+
+        if last_interaction_time is not None:
+            gap = (now - last_interaction_time).total_seconds()
+            # Only count time if gap is less than 3 minutes (180 seconds)
+            if gap < SESSION_TIMEOUT_MINUTES * 60:
+                time_to_add = int(gap)
+
+        # Update tracking
+        last_interaction_time = now
+        session_items += 1
+        session_total_accuracy += accuracy
+        _pending_practice_events.append((time_to_add, accuracy, now))
+
+        flush_due = len(_pending_practice_events) >= PRACTICE_FLUSH_EVENTS
+
+    if flush_due:
+        flush_practice_activity()
+
+
+def flush_practice_activity():
+    """Save buffered practice activities (practice time + daily rollup) in one transaction"""
+    global _pending_practice_events, _last_practice_flush
+
+    with _session_lock:
+        events, _pending_practice_events = _pending_practice_events, []
+        _last_practice_flush = time.monotonic()
+
+    try:
+        flush_practice_events(events)
+    except Exception as e:
+        print(f"Saving practice activity failed: {e}")
+        with _session_lock:
+            _pending_practice_events[:0] = events  # Keep them for the next flush
+
+
+def pending_practice_totals() -> tuple:
+    """(activities, practice_seconds) recorded but not yet flushed to the database"""
+    with _session_lock:
+        return (len(_pending_practice_events),
+                sum(seconds for seconds, _, _ in _pending_practice_events))
+
+
+def _practice_flusher():
+    """Save buffered activity once it is PRACTICE_FLUSH_SECONDS old, even if the learner stops"""
+    while True:
+        time.sleep(PRACTICE_FLUSH_SECONDS)
+        if _pending_practice_events and time.monotonic() - _last_practice_flush >= PRACTICE_FLUSH_SECONDS:
+            flush_practice_activity()
+
 
-    if last_interaction_time is not None:
-        gap = (now - last_interaction_time).total_seconds()
-        # Only count time if gap is less than 3 minutes (180 seconds)
-        if gap < SESSION_TIMEOUT_MINUTES * 60:
-            time_to_add = int(gap)
+threading.Thread(target=_practice_flusher, daemon=True).start()
+atexit.register(flush_practice_activity)
 
-    # Update tracking
-    last_interaction_time = now
-    session_items += 1
-    session_total_accuracy += accuracy
 
-    # Save to database - add practice time using database function
-    add_practice_time(time_to_add)
+# ============ Audio Prefetch ============
+# TTS takes 0.3-1.5 s per phrase, so we render the next few phrases in the
+# background while the user is busy with the current one.
 
-    # Also record as a session for stats
-    avg_accuracy = session_total_accuracy / session_items if session_items > 0 else accuracy
-    session_id = start_session("practice")
-    end_session(session_id, 1, accuracy)
+PREFETCH_DEPTH = 3  # Phrases kept ready per (category, voice)
+
+_tts_pool = ThreadPoolExecutor(max_workers=2, thread_name_prefix="tts")
+_prefetch_lock = threading.Lock()
+_prefetched_phrases = {}  # (category, voice) -> deque of (phrase, Future[audio_path])
+
+
+def _fill_prefetch(category: str, voice: str):
+    """Top up the prefetch queue for a category/voice (runs on the TTS pool)"""
+    with _prefetch_lock:
+        queue = _prefetched_phrases.setdefault((category, voice), deque())
+        missing = PREFETCH_DEPTH - len(queue)
+    if missing <= 0:
+        return
+
+    for phrase in pick_phrases(category, missing):
+        future = _tts_pool.submit(text_to_speech, phrase['spanish'], voice)
+        with _prefetch_lock:
+            queue.append((phrase, future))
+
+
+def schedule_prefetch(category: str = "all", voice: str = "female"):
+    """Start rendering upcoming phrases in the background"""
+    _tts_pool.submit(_fill_prefetch, category, voice)
+
+
+def _next_phrase_with_audio(category: str, voice: str):
+    """Return (phrase, audio_path), using prefetched audio when available"""
+    with _prefetch_lock:
+        queue = _prefetched_phrases.get((category, voice))
+        item = queue.popleft() if queue else None
+    schedule_prefetch(category, voice)
+
+    if item:
+        phrase, future = item
+        try:
+            return phrase, future.result()
+        except Exception as e:
+            print(f"Prefetched TTS failed, regenerating: {e}")
+            return phrase, text_to_speech(phrase['spanish'], voice)
+
+    phrases = pick_phrases(category)
+    if not phrases:
+        return None, None
+    return phrases[0], text_to_speech(phrases[0]['spanish'], voice)
 
 
 # ============ Speaking Practice Tab ============
 
-def get_random_phrase(category: str = "all", voice: str = "female"):
-    """Get a random phrase for practice and automatically generate audio"""
-    global current_phrase
+def get_random_phrase(category: str = "all", voice: str = "female", current_phrase: dict = None):
+    """Get a random phrase for practice and automatically generate audio.
 
-    cat = None if category == "all" else category
-    phrases = get_phrases(category=cat, limit=1)
-    if phrases:
-        current_phrase = phrases[0]
+    The chosen phrase is returned as the last value so it can be kept in
+    per-session gr.State rather than a module global.
+    """
+    phrase, audio_path = _next_phrase_with_audio(category, voice)
+    if phrase:
+        current_phrase = phrase
         spanish = current_phrase['spanish']
         english = current_phrase['english']
         notes = current_phrase.get('notes', '')
-        # Auto-generate audio
-        audio_path = text_to_speech(spanish, voice)
         # Return None for user_recording to clear it
-        return spanish, english, notes, audio_path, None
-    return "No phrases found", "", "", None, None
+        return spanish, english, notes, audio_path, None, current_phrase
+    return "No phrases found", "", "", None, None, current_phrase
 
 
-def play_phrase_audio(spanish_text: str, voice: str = "female"):
+async def play_phrase_audio(spanish_text: str, voice: str = "female"):
     """Generate and return audio for the phrase"""
     if not spanish_text:
         return None
-    audio_path = text_to_speech(spanish_text, voice)
+    audio_path = await text_to_speech_async(spanish_text, voice)
     return audio_path
 
 
-def evaluate_pronunciation(audio_file, expected_text: str):
-    """Evaluate user's pronunciation"""
-    global practice_stats
+# Word analysis lines keyed by (correct, has_expected, has_spoken)
+WORD_RESULT_FORMATS = {
+    (True, True, True): "✓ {expected}\n",
+    (False, True, True): "✗ Expected: '{expected}' → You said: '{spoken}' ({similarity}% close)\n",
+    (False, True, False): "✗ Missing: '{expected}'\n",
+    (False, False, True): "? Extra word: '{spoken}'\n",
+}
 
-    if audio_file is None:
-        return "Please record your voice first.", "", 0
+
+def transcribe_recording_chunk(chunk, stream: dict):
+    """Transcribe the recording incrementally while the user is still speaking"""
+    if chunk is None:
+        return stream
+    sample_rate, data = chunk
+    try:
+        return feed_transcription_stream(stream, sample_rate, data)
+    except Exception as e:
+        print(f"Streaming transcription error: {e}")
+        return stream
+
+
+PRONUNCIATION_TEXT_BUDGET = 1.5  # Transcribe up to 1.5x the expected phrase length
+
+
+def evaluate_pronunciation(audio_stream: dict, expected_text: str, current_phrase: dict = None, practice_stats: dict = None):
+    """Score the streamed recording against the phrase (Whisper step).
+
+    LLM feedback is produced by explain_pronunciation_attempt() as a follow-up
+    event, so the single Whisper lane is free for the next learner as soon as
+    the transcript is scored. The scored attempt is returned last for that step.
+    """
+    if practice_stats is None:
+        practice_stats = {"attempts": 0, "total_accuracy": 0}
+
+    if audio_stream is None or len(audio_stream["audio"]) == 0:
+        return "Please record your voice first.", "", 0, practice_stats, None
 
     if not expected_text:
-        return "No phrase to compare against.", "", 0
+        return "No phrase to compare against.", "", 0, practice_stats, None
 
     try:
-        # Transcribe the audio
-        result = transcribe_audio(audio_file)
+        # Most of the recording was already transcribed while streaming. Stop
+        # decoding once we have comfortably more text than the phrase itself.
+        max_chars = int(len(expected_text) * PRONUNCIATION_TEXT_BUDGET) + 10
+        result = finish_transcription_stream(audio_stream, max_chars=max_chars)
         spoken_text = result['text']
 
         # Check if transcription failed (non-Spanish detected)
         if not result.get('success', True):
-            return "Audio unclear - please try again. Speak clearly into the microphone.", f"Whisper heard: {spoken_text}", 0
+            return "Audio unclear - please try again. Speak clearly into the microphone.", f"Whisper heard: {spoken_text}", 0, practice_stats, None
 
         # Compare pronunciation
         comparison = compare_pronunciation(expected_text, spoken_text)
         accuracy = comparison['accuracy']
 
-        # Update stats
-        practice_stats["attempts"] += 1
-        practice_stats["total_accuracy"] += accuracy
-
-        # Get detailed feedback from LLM
-        feedback = get_pronunciation_feedback(expected_text, spoken_text, accuracy)
-
-        # Record attempt in database
-        if current_phrase:
-            record_pronunciation_attempt(
-                current_phrase['id'],
-                expected_text,
-                spoken_text,
-                accuracy,
-                feedback
-            )
+        # Update per-session stats
+        practice_stats = {
+            "attempts": practice_stats["attempts"] + 1,
+            "total_accuracy": practice_stats["total_accuracy"] + accuracy,
+        }
 
         # Record practice activity with smart time tracking
         record_practice_activity(accuracy)
 
         # Format word-by-word results
-        word_results = ""
-        for wr in comparison['word_results']:
-            if wr['correct']:
-                word_results += f"✓ {wr['expected']}\n"
-            elif wr['expected'] and wr['spoken']:
-                word_results += f"✗ Expected: '{wr['expected']}' → You said: '{wr['spoken']}'\n"
-            elif wr['expected']:
-                word_results += f"✗ Missing: '{wr['expected']}'\n"
-            else:
-                word_results += f"? Extra word: '{wr['spoken']}'\n"
+        word_results = "".join(
+            WORD_RESULT_FORMATS[(wr['correct'], bool(wr['expected']), bool(wr['spoken']))].format(
+                expected=wr['expected'], spoken=wr['spoken'], similarity=wr['similarity']
+            )
+            for wr in comparison['word_results']
+        )
+
+        attempt = {
+            "phrase": current_phrase,
+            "expected": expected_text,
+            "spoken": spoken_text,
+            "accuracy": accuracy,
+        }
+        return "Getting feedback...", word_results, accuracy, practice_stats, attempt
+
+    except Exception as e:
+        return f"Error processing audio: {e}", "", 0, practice_stats, None
+
 
-        return feedback, word_results, accuracy
+def explain_pronunciation_attempt(attempt: dict, current_feedback: str = ""):
+    """Stream LLM feedback for a scored attempt, then record it (LLM step)"""
+    if not attempt:
+        yield current_feedback
+        return
 
+    feedback = ""
+    feedback_failed = False
+    try:
+        for delta in get_pronunciation_feedback_stream(attempt['expected'], attempt['spoken'], attempt['accuracy']):
+            feedback += delta
+            yield feedback
+        feedback_failed = feedback.startswith("Error:")
     except Exception as e:
-        return f"Error processing audio: {e}", "", 0
+        feedback_failed = True
+        yield f"Could not get feedback: {e}"
+
+    # Record attempt in database (the score counts even when the LLM failed,
+    # but an error message is not stored as feedback)
+    if attempt['phrase']:
+        record_pronunciation_attempt(
+            attempt['phrase']['id'],
+            attempt['expected'],
+            attempt['spoken'],
+            attempt['accuracy'],
+            None if feedback_failed else feedback
+        )
 
 
 # ============ Conversation Tab ============
 
+# Sentence boundary in a streamed response
+SENTENCE_END_PATTERN = re.compile(r'[.!?…]["»”]?\s')
+
+# Messages of context sent to the LLM - keeps prompt size flat in long chats
+MAX_CHAT_HISTORY = 20
+
+# Separator between an AI message and its inline English translation
+TRANSLATION_MARKER = "\n\n_Translation: "
+
+
+def _message_text(content) -> str:
+    """Get plain text from a chatbot message's content"""
+    # Handle Gradio 6.0 format where content might be a list
+    if isinstance(content, list):
+        # Extract text from list of content blocks
+        text_parts = []
+        for block in content:
+            if isinstance(block, dict) and "text" in block:
+                text_parts.append(block["text"])
+            elif isinstance(block, str):
+                text_parts.append(block)
+        return " ".join(text_parts)
+    if hasattr(content, 'text'):
+        return content.text
+    return str(content)
+
+
+def _history_for_llm(history: list) -> list:
+    """Build the LLM message list from the chatbot history (last MAX_CHAT_HISTORY messages)"""
+    messages = []
+    for msg in history[-MAX_CHAT_HISTORY:]:
+        if isinstance(msg, dict) and msg.get("role") in ("user", "assistant"):
+            text = _message_text(msg.get("content", "")).split(TRANSLATION_MARKER)[0]
+            messages.append({"role": msg["role"], "content": text})
+    return messages
+
+
 def chat_with_ai(user_message: str, history: list, voice: str = "female"):
-    """Chat with AI conversation partner"""
-    global conversation_history
+    """Chat with AI conversation partner.
+
+    The chatbot history is the only record of the conversation; the LLM
+    gets its last MAX_CHAT_HISTORY messages.
 
+    Streams the reply into the chatbot as tokens arrive. Each sentence's
+    audio is generated in the background as soon as the sentence is
+    complete, so the partner speaks sentence N while sentence N+1 is still
+    being written; the clips are sent to the player in order.
+    """
     if not user_message.strip():
-        return history, "", None
+        yield history, "", None
+        return
 
-    # Add user message to history for LLM
-    conversation_history.append({"role": "user", "content": user_message})
+    llm_history = _history_for_llm(history)
 
     # Use Maria (female) or Carlos (male) based on voice selection
     mode = "conversation_female" if voice == "female" else "conversation_male"
 
-    # Get AI response
-    response = chat(user_message, mode=mode, history=conversation_history[:-1])
+    # Update Gradio chat history (Gradio 6.0 format)
+    history = history + [
+        {"role": "user", "content": user_message},
+        {"role": "assistant", "content": ""},
+    ]
 
-    # Add AI response to history
-    conversation_history.append({"role": "assistant", "content": response})
+    response = ""
+    spoken_upto = 0         # End of the text already handed to TTS
+    pending_audio = deque()  # Futures for sentence clips, in speaking order
 
-    # Update Gradio chat history (Gradio 6.0 format)
-    history.append({"role": "user", "content": user_message})
-    history.append({"role": "assistant", "content": response})
+    for delta in chat_stream(user_message, mode=mode, history=llm_history):
+        response += delta
+        history[-1]["content"] = response
+
+        for match in SENTENCE_END_PATTERN.finditer(response, spoken_upto):
+            sentence = response[spoken_upto:match.end()].strip()
+            spoken_upto = match.end()
+            if sentence:
+                pending_audio.append(_tts_pool.submit(text_to_speech, sentence, voice))
 
-    # Generate audio for auto-play with matching voice
-    audio_path = text_to_speech(response, voice)
+        # One clip per update - the output player queues them in order
+        audio_update = gr.update()
+        if pending_audio and pending_audio[0].done():
+            audio_update = pending_audio.popleft().result()
 
-    return history, "", audio_path
+        yield history, "", audio_update
 
+    # Speak the unterminated tail, then flush the remaining clips in order
+    remainder = response[spoken_upto:].strip()
+    if remainder:
+        pending_audio.append(_tts_pool.submit(text_to_speech, remainder, voice))
+    while pending_audio:
+        yield history, "", pending_audio.popleft().result()
 
-def speak_ai_response(history: list):
+
+async def speak_ai_response(history: list):
     """Convert last AI response to speech"""
     if history and len(history) > 0:
         # Gradio 6.0 format: list of dicts with 'role' and 'content'
@@ -278,15 +585,13 @@ def speak_ai_response(history: list):
             elif not isinstance(content, str):
                 content = str(content)
             if content:
-                audio_path = text_to_speech(content, "female")
+                audio_path = await text_to_speech_async(content, "female")
                 return audio_path
     return None
 
 
 def clear_conversation():
     """Clear conversation history"""
-    global conversation_history
-    conversation_history = []
     return [], "", ""
 
 
@@ -299,30 +604,17 @@ def translate_last_response(history: list):
     for i in range(len(history) - 1, -1, -1):
         msg = history[i]
         if isinstance(msg, dict) and msg.get("role") == "assistant":
-            content = msg.get("content", "")
-
-            # Handle Gradio 6.0 format where content might be a list
-            if isinstance(content, list):
-                # Extract text from list of content blocks
-                text_parts = []
-                for block in content:
-                    if isinstance(block, dict) and "text" in block:
-                        text_parts.append(block["text"])
-                    elif isinstance(block, str):
-                        text_parts.append(block)
-                content = " ".join(text_parts)
-            elif hasattr(content, 'text'):
-                content = content.text
+            content = _message_text(msg.get("content", ""))
 
             # Skip if already has a translation
-            if "_Translation:_" in str(content):
+            if TRANSLATION_MARKER in content:
                 return history
 
             # Translate
             translation = translate_to_english(content)
 
             # Add translation in smaller italic text below
-            history[i]["content"] = f"{content}\n\n_Translation: {translation}_"
+            history[i]["content"] = f"{content}{TRANSLATION_MARKER}{translation}_"
             break
 
     return history
@@ -330,8 +622,7 @@ def translate_last_response(history: list):
 
 def suggest_next_response(history: list):
     """Suggest what the user could say next"""
-    global conversation_history
-
+    conversation_history = _history_for_llm(history or [])
     if not conversation_history:
         return history, "Try saying: ¡Hola! ¿Cómo estás?"
 
@@ -342,12 +633,14 @@ def suggest_next_response(history: list):
     return history, f"💡 Try saying: _{suggestion}_"
 
 
-def transcribe_voice_input(audio_file):
-    """Transcribe voice input for conversation"""
-    if audio_file is None:
+def transcribe_voice_input(recording):
+    """Transcribe voice input for conversation (in-memory numpy recording)"""
+    if recording is None:
         return ""
     try:
-        result = transcribe_audio(audio_file)
+        sample_rate, data = recording
+        # Free-form messages can run long, so decode their speech chunks in batches
+        result = transcribe_audio_from_array(data, sample_rate, batch_size=WHISPER_BATCH_SIZE)
         return result['text']
     except Exception as e:
         return f"Error: {e}"
@@ -355,100 +648,100 @@ def transcribe_voice_input(audio_file):
 
 # ============ Vocabulary Tab ============
 
-# Store the current vocab English translation for reveal
-current_vocab_english = ""
-# Queue for on-demand practice (struggling/learning words)
-vocab_practice_queue = []
-# Track offset for "Practice N Words" buttons (reset when switching status)
-vocab_practice_offset = {'learning': 0, 'struggling': 0}
+# The on-demand practice queue (struggling/learning words) and the offsets for
+# the "Practice N Words" buttons live in per-session gr.State, so each browser
+# session works through its own words.
+PRACTICE_OFFSETS_START = {'learning': 0, 'struggling': 0}
+
+
+def _prefetch_vocab_audio(upcoming: list):
+    """Generate the next card's audio while the learner answers this one"""
+    # text_to_speech caches the clip, so the next card's call is a cache hit
+    # (or joins the synthesis if it is still running)
+    for item in upcoming:
+        _tts_pool.submit(text_to_speech, item['spanish'], "female")
 
-def get_vocab_for_review():
-    """Get vocabulary items due for review - hide English initially, autoplay audio"""
-    global current_vocab_english, vocab_practice_queue
+
+def get_vocab_for_review(practice_queue: list = None, due_items: list = None):
+    """Get vocabulary items due for review - hide English initially, autoplay audio.
+
+    The full item is returned so the Reveal button can read it from
+    per-session gr.State instead of querying the database again, followed
+    by the remaining practice queue. Pass due_items when the next review
+    items were already fetched (see submit_vocab_review); a second item,
+    when there is one, gets its audio prefetched.
+    """
+    practice_queue = list(practice_queue or [])
 
     # First check if we have queued words from "Practice Struggling/Learning" buttons
-    if vocab_practice_queue:
-        item = vocab_practice_queue.pop(0)
-        current_vocab_english = item['english']
+    if practice_queue:
+        item = practice_queue.pop(0)
         audio_path = text_to_speech(item['spanish'], "female")
-        remaining = len(vocab_practice_queue)
+        _prefetch_vocab_audio(practice_queue[:1])
+        remaining = len(practice_queue)
         status_msg = f"({remaining} more in queue)" if remaining > 0 else ""
-        return item['spanish'], f"Click 'Reveal' to see translation {status_msg}", item['id'], "", audio_path
+        return item['spanish'], f"Click 'Reveal' to see translation {status_msg}", item['id'], "", audio_path, item, practice_queue
 
     # Otherwise use normal spaced repetition
-    vocab = get_vocabulary_for_review(limit=1)
+    vocab = due_items if due_items is not None else get_vocabulary_for_review(limit=2)
     if vocab:
         item = vocab[0]
-        current_vocab_english = item['english']
         # Generate audio for autoplay
         audio_path = text_to_speech(item['spanish'], "female")
+        _prefetch_vocab_audio(vocab[1:])
         # Return Spanish but hide English (show placeholder), plus audio
-        return item['spanish'], "Click 'Reveal' to see translation", item['id'], "", audio_path
-    current_vocab_english = ""
-    return "No vocabulary due for review!", "", None, "", None
+        return item['spanish'], "Click 'Reveal' to see translation", item['id'], "", audio_path, item, practice_queue
+    return "No vocabulary due for review!", "", None, "", None, None, practice_queue
 
 
-def load_struggling_words():
-    """Load next 20 struggling words into the practice queue"""
-    global vocab_practice_queue, vocab_practice_offset
+PRACTICE_BATCH_SIZE = 20
+
+# Renders a freshly loaded practice batch in the background, separate from
+# _tts_pool so conversation audio never queues behind it
+_queue_audio_pool = ThreadPoolExecutor(max_workers=8, thread_name_prefix="tts-queue")
+
 
-    # Get total count to know when to wrap around
-    total = count_vocabulary_by_status('struggling')
-    if total == 0:
-        return "No struggling words found."
+def _load_status_queue(status: str, practice_queue: list = None, practice_offsets: dict = None):
+    """Load the next batch of words with a status into the practice queue"""
+    practice_offsets = dict(practice_offsets or PRACTICE_OFFSETS_START)
 
-    # Get next batch with current offset
-    words = get_vocabulary_by_status('struggling', limit=20, offset=vocab_practice_offset['struggling'])
+    # Get next batch with current offset; the total comes back with it, and
+    # an offset past the end has already wrapped to the start
+    offset = practice_offsets[status]
+    words, total = get_vocabulary_by_status_with_count(
+        status, limit=PRACTICE_BATCH_SIZE, offset=offset)
+    if offset >= total:
+        offset = 0
 
     # If we got fewer words than requested, we've reached the end - wrap around
-    if len(words) < 20:
-        vocab_practice_offset['struggling'] = 0
-        if len(words) == 0:
-            words = get_vocabulary_by_status('struggling', limit=20, offset=0)
+    if len(words) < PRACTICE_BATCH_SIZE:
+        practice_offsets[status] = 0
     else:
-        vocab_practice_offset['struggling'] += 20
+        practice_offsets[status] = offset + PRACTICE_BATCH_SIZE
 
     if words:
-        vocab_practice_queue = words
-        remaining = total - vocab_practice_offset['struggling']
-        if remaining < 0:
-            remaining = total
-        return f"📚 Loaded {len(words)} struggling words ({remaining} more available). Go to Vocabulary tab!"
-    return "No struggling words found."
+        # Generate the whole batch's audio now, so each card is a cache hit
+        for word in words:
+            _queue_audio_pool.submit(text_to_speech, word['spanish'], "female")
 
+        remaining = total - practice_offsets[status]
+        return f"📚 Loaded {len(words)} {status} words ({remaining} more available). Go to Vocabulary tab!", words, practice_offsets
+    return f"No {status} words found.", practice_queue or [], practice_offsets
 
-def load_learning_words():
-    """Load next 20 learning words into the practice queue"""
-    global vocab_practice_queue, vocab_practice_offset
-
-    # Get total count to know when to wrap around
-    total = count_vocabulary_by_status('learning')
-    if total == 0:
-        return "No learning words found."
 
-    # Get next batch with current offset
-    words = get_vocabulary_by_status('learning', limit=20, offset=vocab_practice_offset['learning'])
+def load_struggling_words(practice_queue: list = None, practice_offsets: dict = None):
+    """Load next 20 struggling words into the practice queue"""
+    return _load_status_queue('struggling', practice_queue, practice_offsets)
 
-    # If we got fewer words than requested, we've reached the end - wrap around
-    if len(words) < 20:
-        vocab_practice_offset['learning'] = 0
-        if len(words) == 0:
-            words = get_vocabulary_by_status('learning', limit=20, offset=0)
-    else:
-        vocab_practice_offset['learning'] += 20
 
-    if words:
-        vocab_practice_queue = words
-        remaining = total - vocab_practice_offset['learning']
-        if remaining < 0:
-            remaining = total
-        return f"📚 Loaded {len(words)} learning words ({remaining} more available). Go to Vocabulary tab!"
-    return "No learning words found."
+def load_learning_words(practice_queue: list = None, practice_offsets: dict = None):
+    """Load next 20 learning words into the practice queue"""
+    return _load_status_queue('learning', practice_queue, practice_offsets)
 
 
-def get_pipeline_display():
+def get_pipeline_display(snapshot: dict = None):
     """Generate the vocabulary pipeline display for the Home tab"""
-    stats = get_vocabulary_pipeline_stats()
+    stats = (snapshot or get_home_snapshot())['pipeline']
 
     learning_reps = stats['learning_by_reps']
 
@@ -471,34 +764,37 @@ def get_pipeline_display():
     return display
 
 
-def reveal_vocab_translation():
-    """Reveal the English translation"""
-    global current_vocab_english
-    vocab = get_vocabulary_for_review(limit=1)
-    if vocab:
-        item = vocab[0]
-        return item['english'], item.get('example_sentence', '')
-    return current_vocab_english, ""
+def reveal_vocab_translation(current_vocab_item: dict = None):
+    """Reveal the English translation of the word on screen (no database query)"""
+    if not current_vocab_item:
+        return "", ""
+    return current_vocab_item['english'], current_vocab_item.get('example_sentence') or ""
 
 
-def play_vocab_audio(spanish_word: str):
+async def play_vocab_audio(spanish_word: str):
     """Generate audio for vocabulary word"""
     if spanish_word and spanish_word != "No vocabulary due for review!":
-        return text_to_speech(spanish_word, "female")
+        return await text_to_speech_async(spanish_word, "female")
     return None
 
 
-def submit_vocab_review(vocab_id: int, quality: int):
+def submit_vocab_review(vocab_id: int, quality: int, practice_queue: list = None):
     """Submit vocabulary review result and get next word with autoplay"""
     if vocab_id:
-        update_vocabulary_progress(vocab_id, quality)
+        if practice_queue:
+            # Next word comes from the practice queue, no need to query the review list
+            update_vocabulary_progress(vocab_id, quality)
+            due_items = None
+        else:
+            # Grade and fetch the next due word in one transaction
+            due_items = update_and_next(int(vocab_id), quality, limit=2)
 
         # Record practice activity - quality 3+ = "correct" (Good/Easy)
         accuracy = 100.0 if quality >= 3 else 0.0
         record_practice_activity(accuracy)
 
-        return get_vocab_for_review()
-    return "No vocabulary selected", "", None, "", None
+        return get_vocab_for_review(practice_queue, due_items)
+    return "No vocabulary selected", "", None, "", None, None, practice_queue or []
 
 
 def get_vocab_help(word: str):
@@ -508,17 +804,20 @@ def get_vocab_help(word: str):
     return ""
 
 
-def delete_current_vocab(vocab_id: int):
+def delete_current_vocab(vocab_id: int, practice_queue: list = None):
     """Delete the current vocabulary word and get the next one."""
     if vocab_id:
         success = delete_vocabulary_word(int(vocab_id))
         if success:
             # Get next word after deletion
-            next_word = get_vocab_for_review()
+            next_word = get_vocab_for_review(practice_queue)
             return ("✅ Word deleted!",) + next_word
         else:
-            return ("❌ Word not found",) + get_vocab_for_review()
-    return ("No word selected",) + get_vocab_for_review()
+            return ("❌ Word not found",) + get_vocab_for_review(practice_queue)
+    return ("No word selected",) + get_vocab_for_review(practice_queue)
+
+
+_memory_aid_pool = ThreadPoolExecutor(max_workers=3, thread_name_prefix="memory-aid")
 
 
 def help_me_remember(vocab_id: int):
@@ -541,17 +840,23 @@ def help_me_remember(vocab_id: int):
     # Use unit_name as category (category field is often None)
     category = vocab_item.get('unit_name') or vocab_item.get('category') or ''
 
-    # Get image (only for imageable categories)
-    image_url, credit, imageable = get_memory_image(spanish, english, category)
+    # Imported here: the image search (and requests) is only needed for memory aids
+    from src.images import get_memory_image
+
+    # Get image (only for imageable categories) while the LLM writes the sentence
+    image_future = _memory_aid_pool.submit(get_memory_image, spanish, english, category)
 
     # Generate a memorable sentence
     sentence = generate_memory_sentence(spanish, english)
 
-    # Translate the sentence to English (use FAST_MODEL for speed - simple sentences don't need ACCURATE_MODEL)
-    sentence_english = translate_to_english(sentence, model=FAST_MODEL)
+    # Translation and audio both only need the sentence, so run them side by side
+    # (use FAST_MODEL for speed - simple sentences don't need ACCURATE_MODEL)
+    translation_future = _memory_aid_pool.submit(translate_to_english, sentence, model=FAST_MODEL)
+    audio_future = _memory_aid_pool.submit(text_to_speech, sentence, "female")
 
-    # Generate audio for the sentence
-    sentence_audio = text_to_speech(sentence, "female")
+    image_url, credit, imageable = image_future.result()
+    sentence_english = translation_future.result()
+    sentence_audio = audio_future.result()
 
     # Build info message
     if imageable and not image_url:
@@ -568,35 +873,25 @@ def help_me_remember(vocab_id: int):
 
 def generate_listening_exercise(category: str = "all"):
     """Generate a listening exercise"""
-    cat = None if category == "all" else category
-    phrases = get_phrases(category=cat, limit=1)
-    if phrases:
-        phrase = phrases[0]
-        audio_path = text_to_speech(phrase['spanish'], "female")
+    phrase, audio_path = _next_phrase_with_audio(category, "female")
+    if phrase:
         return audio_path, phrase['spanish'], phrase['english'], ""
     return None, "", "", ""
 
 
+# ¿ ¡ ? ! , . plus the combining accents NFD splits off (é -> e + U+0301)
+COMPARISON_STRIP_PATTERN = re.compile('[¿¡?!,.\u0300-\u036f]+')
+
+
+@functools.lru_cache(maxsize=1024)
 def normalize_for_comparison(text: str) -> str:
     """Normalize text for lenient comparison (beginner-friendly).
     Removes accents, special punctuation, and normalizes whitespace.
     """
-    import unicodedata
-
-    # Remove inverted punctuation (¿ ¡) and regular punctuation
-    text = text.replace('¿', '').replace('¡', '')
-    text = text.replace('?', '').replace('!', '').replace(',', '').replace('.', '')
-
-    # Normalize unicode and remove accents
-    # NFD decomposes accented chars (é -> e + combining accent)
-    # Then we filter out the combining marks
-    normalized = unicodedata.normalize('NFD', text)
-    text = ''.join(c for c in normalized if unicodedata.category(c) != 'Mn')
+    text = COMPARISON_STRIP_PATTERN.sub('', unicodedata.normalize('NFD', text))
 
     # Lowercase and normalize whitespace
-    text = ' '.join(text.lower().split())
-
-    return text
+    return ' '.join(text.lower().split())
 
 
 def check_listening_answer(user_answer: str, correct_answer: str):
@@ -608,21 +903,9 @@ def check_listening_answer(user_answer: str, correct_answer: str):
     user_normalized = normalize_for_comparison(user_answer)
     correct_normalized = normalize_for_comparison(correct_answer)
 
-    # Check for exact match after normalization
-    if user_normalized == correct_normalized:
-        accuracy = 100.0
-    else:
-        # Word-by-word comparison on normalized text
-        user_words = user_normalized.split()
-        correct_words = correct_normalized.split()
-
-        correct_count = 0
-        for i, word in enumerate(correct_words):
-            if i < len(user_words) and user_words[i] == word:
-                correct_count += 1
-
-        total = max(len(correct_words), len(user_words))
-        accuracy = (correct_count / total * 100) if total > 0 else 0
+    # Character-level similarity of the sorted words (RapidFuzz, C++): a dropped
+    # word or small typo costs a little instead of misaligning every later word
+    accuracy = fuzz.token_sort_ratio(user_normalized, correct_normalized)
 
     # Record practice activity with smart time tracking
     record_practice_activity(accuracy)
@@ -648,58 +931,45 @@ def explain_phrase_grammar(phrase: str):
 
 def get_learning_path_display():
     """Generate visual learning path display"""
-    sections = get_sections()
-    units = get_units()
-    progress = get_user_progress()
-
-    # Build unit lookup by section
-    units_by_section = {}
-    for unit in units:
-        section_id = unit['section_id']
-        if section_id not in units_by_section:
-            units_by_section[section_id] = []
-        units_by_section[section_id].append(unit)
+    sections = get_learning_path()
 
     # Build markdown display
-    md = "## Your Learning Journey\n\n"
+    parts = ["## Your Learning Journey\n\n"]
 
     for section in sections:
-        section_id = section['id']
         is_unlocked = section['is_unlocked']
 
         # Section header
         lock_icon = "" if is_unlocked else " (Locked)"
-        completed_units = section.get('completed_units', 0)
-        total_units = section.get('total_units', 0)
-
-        md += f"### {'🔓' if is_unlocked else '🔒'} {section['name']}{lock_icon}\n"
-        md += f"*{section['description']}*\n\n"
-
-        if section_id in units_by_section:
-            for unit in units_by_section[section_id]:
-                unit_unlocked = unit['is_unlocked']
-                unit_completed = unit['is_completed']
-                word_count = unit.get('word_count', 0)
-                phrase_count = unit.get('phrase_count', 0)
-
-                # Unit status icon
-                if unit_completed:
-                    status_icon = "✅"
-                elif unit_unlocked:
-                    status_icon = "📖"
-                else:
-                    status_icon = "🔒"
 
-                md += f"  {status_icon} **{unit['name']}** ({word_count} words, {phrase_count} phrases)\n"
+        parts.append(f"### {'🔓' if is_unlocked else '🔒'} {section['name']}{lock_icon}\n")
+        parts.append(f"*{section['description']}*\n\n")
+
+        for unit in section['units']:
+            unit_unlocked = unit['is_unlocked']
+            unit_completed = unit['is_completed']
+            word_count = unit.get('word_count', 0)
+            phrase_count = unit.get('phrase_count', 0)
+
+            # Unit status icon
+            if unit_completed:
+                status_icon = "✅"
+            elif unit_unlocked:
+                status_icon = "📖"
+            else:
+                status_icon = "🔒"
+
+            parts.append(f"  {status_icon} **{unit['name']}** ({word_count} words, {phrase_count} phrases)\n")
 
-        md += "\n---\n\n"
+        parts.append("\n---\n\n")
 
-    return md
+    return ''.join(parts)
 
 
-def get_xp_display():
+def get_xp_display(snapshot: dict = None):
     """Get XP and level display"""
-    progress = get_user_progress()
+    snapshot = snapshot or get_home_snapshot()
+    progress = snapshot['progress']
     total_xp = progress.get('total_xp', 0)
     level = progress.get('current_level', 1)
     streak = progress.get('streak_days', 0)
@@ -717,7 +987,7 @@ def get_xp_display():
     bar_empty = 20 - bar_filled
     progress_bar = "█" * bar_filled + "░" * bar_empty
 
-    md = f"""
+    parts = [f"""
 ## Level {level}
 
 **Total XP:** {total_xp}
@@ -731,10 +1001,10 @@ def get_xp_display():
 ---
 
 ### Vocabulary Progress
-"""
+"""]
 
-    vocab_stats = get_vocabulary_stats()
-    md += f"""
+    vocab_stats = snapshot['vocabulary']
+    parts.append(f"""
 | Status | Count |
 |--------|-------|
 | 🆕 New | {vocab_stats.get('new', 0)} |
@@ -743,16 +1013,17 @@ def get_xp_display():
 | ⚠️ Struggling | {vocab_stats.get('struggling', 0)} |
 | 🔄 Due for Review | {vocab_stats.get('due', 0)} |
 | **Total** | {vocab_stats.get('total', 0)} |
-"""
+""")
 
-    return md
+    return ''.join(parts)
 
 
-def get_ai_coach_display():
+def get_ai_coach_display(snapshot: dict = None):
     """Get AI Coach recommendations"""
-    recommendations = get_recommended_activities()
-    daily = get_daily_goal_progress()
-    progress = get_user_progress()
+    snapshot = snapshot or get_home_snapshot()
+    daily = snapshot['daily']
+    recommendations = get_recommended_activities(snapshot['vocabulary'], daily)
+    progress = snapshot['progress']
     streak = progress.get('streak_days', 0)
 
     # Build greeting
@@ -761,7 +1032,7 @@ def get_ai_coach_display():
     else:
         greeting = "Welcome back! Let's start learning today!"
 
-    md = f"""
+    parts = [f"""
 ## Your AI Coach
 
 {greeting}
@@ -780,7 +1051,7 @@ def get_ai_coach_display():
 
 ### Recommended Activities
 
-"""
+"""]
 
     for rec in recommendations:
         emoji = {
@@ -790,10 +1061,35 @@ def get_ai_coach_display():
             'conversation': '💬'
         }.get(rec['type'], '📌')
 
-        md += f"**{emoji} {rec['title']}**\n"
-        md += f"*{rec['description']}* (+{rec['xp_reward']} XP)\n\n"
+        parts.append(f"**{emoji} {rec['title']}**\n")
+        parts.append(f"*{rec['description']}* (+{rec['xp_reward']} XP)\n\n")
+
+    return ''.join(parts)
+
 
-    return md
+# Home panels are rebuilt only after a write (or every STATS_CACHE_SECONDS, for
+# the due counts), so switching back to Home is a lookup
+_home_cache = (None, None, 0.0)  # (displays, data_version, rendered_at)
+
+
+def refresh_home_displays():
+    """Coach, XP and pipeline panels (served from cache while still current)"""
+    global _home_cache
+    displays, version, rendered_at = _home_cache
+    if (displays is not None and version == get_data_version()
+            and time.time() - rendered_at < STATS_CACHE_SECONDS):
+        return displays
+    version = get_data_version()  # Read first so a concurrent write marks the result stale
+
+    # Build all three panels from a single database snapshot
+    snapshot = get_home_snapshot()
+    displays = (
+        get_ai_coach_display(snapshot),
+        get_xp_display(snapshot),
+        get_pipeline_display(snapshot),
+    )
+    _home_cache = (displays, version, time.time())
+    return displays
 
 
 def get_new_words_display():
@@ -803,17 +1099,17 @@ def get_new_words_display():
     if not new_words:
         return "No new words available right now. Complete more units to unlock new vocabulary!"
 
-    md = "## New Words to Learn\n\n"
+    parts = ["## New Words to Learn\n\n"]
 
     for word in new_words:
-        md += f"**{word['spanish']}** - {word['english']}\n"
+        parts.append(f"**{word['spanish']}** - {word['english']}\n")
         if word.get('example_sentence'):
-            md += f"*{word['example_sentence']}*\n"
-        md += "\n"
+            parts.append(f"*{word['example_sentence']}*\n")
+        parts.append("\n")
 
-    md += "\n*These words have been added to your review queue!*"
+    parts.append("\n*These words have been added to your review queue!*")
 
-    return md
+    return ''.join(parts)
 
 
 # ============ Statistics Tab ============
@@ -884,8 +1180,39 @@ Your vocabulary comprehension has been multiplied! These forms will now be recog
         return f"### ❌ Error\n\nFailed to generate word forms: {e}\n\nMake sure Ollama is running and try again."
 
 
+# The stats page and CEFR score run several aggregate queries, so their
+# results are cached until the next write (or for 30 s, since "due for
+# review" counts change with time alone); the stats queries are also re-run
+# in the background after each write
+STATS_CACHE_SECONDS = 30
+STATS_REFRESH_POLL_SECONDS = 5
+
+_cefr_cache = (None, None, 0.0)  # (displays, data_version, rendered_at)
+
+# Ten-step score bars, indexed by score // 10
+PROGRESS_BARS = tuple('█' * filled + '░' * (10 - filled) for filled in range(11))
+
+
+def score_bar(score: float) -> str:
+    """Ten-step bar for a 0-100 score (out-of-range scores are clamped)"""
+    return PROGRESS_BARS[max(0, min(10, int(score // 10)))]
+
+
 def display_unified_cefr_score():
-    """Display unified multi-dimensional CEFR proficiency score"""
+    """Display unified CEFR score (served from cache while still current)"""
+    global _cefr_cache
+    displays, version, rendered_at = _cefr_cache
+    if (displays is not None and version == get_data_version()
+            and time.time() - rendered_at < STATS_CACHE_SECONDS):
+        return displays
+    version = get_data_version()  # Read first so a concurrent write marks the result stale
+    displays = _render_unified_cefr_score()
+    _cefr_cache = (displays, version, time.time())
+    return displays
+
+
+def _render_unified_cefr_score():
+    """Build the unified multi-dimensional CEFR proficiency displays"""
     from src.database import calculate_unified_cefr_score
 
     result = calculate_unified_cefr_score()
@@ -895,7 +1222,7 @@ def display_unified_cefr_score():
 
 **Score: {result['overall_score']}%**
 
-Progress to next level: {'█' * int(result['overall_score'] / 10)}{'░' * (10 - int(result['overall_score'] / 10))} {result['overall_score']}%
+Progress to next level: {score_bar(result['overall_score'])} {result['overall_score']}%
 """
 
     # Dimension displays
@@ -904,7 +1231,7 @@ Progress to next level: {'█' * int(result['overall_score'] / 10)}{'░' * (10
 
 **{vocab_dim['cefr_level']}** - {vocab_dim['score']:.1f}%
 
-{'█' * int(vocab_dim['score'] / 10)}{'░' * (10 - int(vocab_dim['score'] / 10))}
+{score_bar(vocab_dim['score'])}
 
 📊 {vocab_dim['effective_word_count']} effective words
 🎯 Target for next level: {vocab_dim['target_benchmark']} words
@@ -919,7 +1246,7 @@ Progress to next level: {'█' * int(result['overall_score'] / 10)}{'░' * (10
 
 **{grammar_dim['cefr_level']}** - {grammar_dim['score']:.1f}%
 
-{'█' * int(grammar_dim['score'] / 10)}{'░' * (10 - int(grammar_dim['score'] / 10))}
+{score_bar(grammar_dim['score'])}
 
 ✓ {grammar_dim['mastered']} mastered
 📝 {grammar_dim['learned']} learned
@@ -931,7 +1258,7 @@ Progress to next level: {'█' * int(result['overall_score'] / 10)}{'░' * (10
 
 **{speaking_dim['cefr_level']}** - {speaking_dim['score']:.1f}%
 
-{'█' * int(speaking_dim['score'] / 10)}{'░' * (10 - int(speaking_dim['score'] / 10))}
+{score_bar(speaking_dim['score'])}
 
 🎤 {speaking_dim['attempts']} attempts
 📊 {speaking_dim['recent_avg']:.1f}% recent accuracy
@@ -942,7 +1269,7 @@ Progress to next level: {'█' * int(result['overall_score'] / 10)}{'░' * (10
 
 **{content_dim['cefr_level']}** - {content_dim['score']:.1f}%
 
-{'█' * int(content_dim['score'] / 10)}{'░' * (10 - int(content_dim['score'] / 10))}
+{score_bar(content_dim['score'])}
 
 ✓ {content_dim['mastered_packages']} mastered
 📦 {content_dim['total_packages']} total packages
@@ -970,10 +1297,45 @@ Progress to next level: {'█' * int(result['overall_score'] / 10)}{'░' * (10
     return main_display, vocab_display, grammar_display, speaking_display, content_display, gating_display
 
 
+_stats_cache = (None, None, 0.0)  # (statistics, data_version, fetched_at)
+
+
 def get_stats_display():
-    """Get formatted statistics"""
+    """Get formatted statistics (queries served from cache while still current)"""
+    stats, version, fetched_at = _stats_cache
+    if (stats is None or version != get_data_version()
+            or time.time() - fetched_at >= STATS_CACHE_SECONDS):
+        stats = _refresh_statistics()
+    return _render_stats_display(stats)
+
+
+def _refresh_statistics() -> dict:
+    """Re-run the statistics queries and store the result in the cache"""
+    global _stats_cache
+    version = get_data_version()  # Read first so a concurrent write marks the result stale
     stats = get_statistics()
-    progress = get_user_progress()
+    _stats_cache = (stats, version, time.time())
+    return stats
+
+
+def _stats_refresher():
+    """Keep the stats cache warm after each write so opening the Progress tab is instant"""
+    while True:
+        time.sleep(STATS_REFRESH_POLL_SECONDS)
+        if _stats_cache[1] != get_data_version():
+            try:
+                _refresh_statistics()
+            except Exception as e:
+                print(f"Stats refresh failed: {e}")
+
+
+def _render_stats_display(stats: dict) -> str:
+    """Build the statistics Markdown"""
+    # Activity still waiting in the practice buffer is added on top rather
+    # than flushed here, so viewing stats doesn't defeat the batching
+    pending_items, pending_seconds = pending_practice_totals()
+    total_sessions = stats['total_sessions'] + pending_items
+    total_practice_minutes = round(stats['total_practice_minutes'] + pending_seconds / 60, 1)
 
     return f"""
 ## Your Learning Progress
@@ -981,24 +1343,24 @@ def get_stats_display():
 ### Overall Stats
 | Metric | Value |
 |--------|-------|
-| **Level** | {progress.get('current_level', 1)} |
-| **Total XP** | {progress.get('total_xp', 0)} |
-| **Current Streak** | {progress.get('streak_days', 0)} days |
-| **Longest Streak** | {progress.get('longest_streak', 0)} days |
+| **Level** | {stats.get('current_level', 1)} |
+| **Total XP** | {stats.get('total_xp', 0)} |
+| **Current Streak** | {stats.get('streak_days', 0)} days |
+| **Longest Streak** | {stats.get('longest_streak', 0)} days |
 
 ### Content Progress
 | Metric | Value |
 |--------|-------|
 | Total Vocabulary | {stats['total_vocabulary']} words |
-| Words Learning | {progress.get('words_learning', 0)} |
-| Words Mastered | {progress.get('words_mastered', 0)} |
+| Words Learning | {stats.get('words_learning', 0)} |
+| Words Mastered | {stats.get('words_mastered', 0)} |
 | Total Phrases | {stats['total_phrases']} phrases |
 
 ### Practice Stats
 | Metric | Value |
 |--------|-------|
-| Practice Sessions | {stats['total_sessions']} |
-| Total Practice Time | {stats['total_practice_minutes']} minutes |
+| Practice Sessions | {total_sessions} |
+| Total Practice Time | {total_practice_minutes} minutes |
 | Average Accuracy | {stats['average_accuracy']}% |
 | Recent Accuracy (7 days) | {stats['recent_accuracy']}% |
 | Vocabulary Due for Review | {stats['vocabulary_due']} words |
@@ -1007,18 +1369,50 @@ Keep practicing daily for best results!
 """
 
 
+threading.Thread(target=_stats_refresher, daemon=True).start()
+
+
 # ============ Content Analysis Functions ============
 
+# Recent analyses, so saving a package reuses the analysis the user just saw
+# instead of re-analyzing the same text (dropped once the vocabulary changes)
+ANALYSIS_CACHE_SIZE = 4
+_recent_analyses = OrderedDict()  # text -> (ContentAnalysis, data_version)
+_recent_analyses_lock = threading.Lock()
+
+
+def _analyze_content_cached(text: str) -> ContentAnalysis:
+    """analyze_content, served from the recent analyses while still current"""
+    with _recent_analyses_lock:
+        cached = _recent_analyses.get(text)
+        if cached is not None and cached[1] == get_data_version():
+            _recent_analyses.move_to_end(text)
+            return cached[0]
+
+    version = get_data_version()  # Read first so a concurrent write marks the result stale
+    result = analyze_content(text)
+    with _recent_analyses_lock:
+        _recent_analyses[text] = (result, version)
+        _recent_analyses.move_to_end(text)
+        if len(_recent_analyses) > ANALYSIS_CACHE_SIZE:
+            _recent_analyses.popitem(last=False)
+    return result
+
+
+# Rows sent to the new-words table; the rest are counted in a note below it
+NEW_WORDS_DISPLAY_LIMIT = 30
+
+
 def analyze_text_content(text: str):
     """Analyze Spanish text and return results for display."""
     if not text or not text.strip():
-        return "Please enter some Spanish text to analyze.", "", "", gr.update(visible=False), ""
+        return "Please enter some Spanish text to analyze.", [], "", gr.update(visible=False), ""
 
     try:
-        result = analyze_content(text)
+        result = _analyze_content_cached(text)
 
         # Build summary display
-        summary = f"""## Analysis Results
+        parts = [f"""## Analysis Results
 
 | Metric | Value |
 |--------|-------|
@@ -1034,21 +1428,21 @@ def analyze_text_content(text: str):
 
 **Grammar Readiness:** {result.grammar_readiness:.1f}%
 
-"""
+"""]
 
         # Add grammar patterns matched
         if result.grammar_patterns_matched:
-            summary += "**Grammar You Know:**\n"
-            for pattern in result.grammar_patterns_matched:
-                summary += f"- ✅ {pattern['display_name']} ({pattern['count']} uses)\n"
-            summary += "\n"
+            parts.append("**Grammar You Know:**\n")
+            parts.extend(f"- ✅ {pattern['display_name']} ({pattern['count']} uses)\n"
+                         for pattern in result.grammar_patterns_matched)
+            parts.append("\n")
 
         # Add unknown grammar patterns
         if result.grammar_patterns_unknown:
-            summary += "**Grammar to Learn:**\n"
-            for pattern in result.grammar_patterns_unknown:
-                summary += f"- ❌ {pattern['display_name']} ({pattern['count']} uses)\n"
-            summary += "\n"
+            parts.append("**Grammar to Learn:**\n")
+            parts.extend(f"- ❌ {pattern['display_name']} ({pattern['count']} uses)\n"
+                         for pattern in result.grammar_patterns_unknown)
+            parts.append("\n")
 
         # Grammar recommendation
         from src.grammar_patterns import get_grammar_recommendation
@@ -1057,25 +1451,19 @@ def analyze_text_content(text: str):
              'unknown_patterns': result.grammar_patterns_unknown},
             result.comprehension_pct
         )
-        summary += f"### Recommendation\n{grammar_rec}\n"
-"""
-
-        # Build new words display
-        if result.new_words_details:
-            new_words_md = "## New Words to Learn\n\n"
-            new_words_md += "| Word | Translation | Level | Frequency | DELE A2 |\n"
-            new_words_md += "|------|-------------|-------|-----------|--------|\n"
-
-            for word in result.new_words_details[:30]:  # Limit to 30 words
-                dele_marker = "✅" if word.in_dele_a2 else ""
-                freq_label = "⭐" if word.frequency_rank <= 1500 else ""
-                translation = word.english or "—"
-                new_words_md += f"| {word.spanish} | {translation} | {word.cefr_level} | {freq_label} {word.frequency_rank} | {dele_marker} |\n"
-
-            if len(result.new_words_details) > 30:
-                new_words_md += f"\n*...and {len(result.new_words_details) - 30} more words*"
-        else:
-            new_words_md = "**Great!** You know all the words in this text!"
+        parts.append(f"### Recommendation\n{grammar_rec}\n")
+        if not result.new_words_details:
+            parts.append("\n**Great!** You know all the words in this text!\n")
+        summary = ''.join(parts)
+
+        # New words table rows (already sorted by frequency, most common first)
+        new_words_rows = [
+            [word.spanish, word.english or "—", word.cefr_level, word.frequency_rank,
+             "✅" if word.in_dele_a2 else ""]
+            for word in result.new_words_details[:NEW_WORDS_DISPLAY_LIMIT]
+        ]
+        more_words = len(result.new_words_details) - NEW_WORDS_DISPLAY_LIMIT
+        more_words_md = f"*...and {more_words} more words*\n\n" if more_words > 0 else ""
 
         # High value words (top frequency to prioritize)
         high_value = result.high_value_words
@@ -1086,14 +1474,15 @@ def analyze_text_content(text: str):
             priority_md += ", ".join(priority_words)
         else:
             priority_md = ""
+        priority_md = more_words_md + priority_md
 
         # Show save button if there are new words
         show_save = len(result.new_words_details) > 0
 
-        return summary, new_words_md, priority_md, gr.update(visible=show_save), text
+        return summary, new_words_rows, priority_md, gr.update(visible=show_save), text
 
     except Exception as e:
-        return f"Error analyzing text: {str(e)}", "", "", gr.update(visible=False), ""
+        return f"Error analyzing text: {str(e)}", [], "", gr.update(visible=False), ""
 
 
 def extract_and_analyze_content(source_type: str, url_input: str, file_obj, text_input: str):
@@ -1101,28 +1490,28 @@ def extract_and_analyze_content(source_type: str, url_input: str, file_obj, text
     # Determine source and extract content
     if source_type == "YouTube URL":
         if not url_input or not url_input.strip():
-            return "Please enter a YouTube URL.", "", "", gr.update(visible=False), "", ""
+            return "Please enter a YouTube URL.", [], "", gr.update(visible=False), "", ""
         result = extract_youtube_transcript(url_input.strip())
     elif source_type == "Website URL":
         if not url_input or not url_input.strip():
-            return "Please enter a website URL.", "", "", gr.update(visible=False), "", ""
+            return "Please enter a website URL.", [], "", gr.update(visible=False), "", ""
         result = fetch_website_content(url_input.strip())
     elif source_type == "Upload File":
         if file_obj is None:
-            return "Please upload a file (TXT, SRT, or PDF).", "", "", gr.update(visible=False), "", ""
+            return "Please upload a file (TXT, SRT, or PDF).", [], "", gr.update(visible=False), "", ""
         result = extract_text_from_file(file_obj.name)
     else:  # Paste Text
         if not text_input or not text_input.strip():
-            return "Please enter some Spanish text.", "", "", gr.update(visible=False), "", ""
+            return "Please enter some Spanish text.", [], "", gr.update(visible=False), "", ""
         # For pasted text, we just use it directly
         return analyze_text_content(text_input.strip()) + ("",)
 
     # Check for extraction errors
     if result.error:
-        return f"**Error:** {result.error}", "", "", gr.update(visible=False), "", ""
+        return f"**Error:** {result.error}", [], "", gr.update(visible=False), "", ""
 
     if not result.text:
-        return "Could not extract any text from this source.", "", "", gr.update(visible=False), "", ""
+        return "Could not extract any text from this source.", [], "", gr.update(visible=False), "", ""
 
     # Build source info
     source_info = f"**Source:** {result.title}"
@@ -1159,20 +1548,22 @@ def save_analysis_as_package(name: str, text: str, progress=gr.Progress()):
         return "No text to save. Please analyze some content first."
 
     try:
-        # Re-analyze to get current results
+        # Reuses the displayed analysis unless the vocabulary has changed since
         progress(0, desc="Analyzing content...")
-        result = analyze_content(text)
+        result = _analyze_content_cached(text)
 
         if result.new_count == 0:
             return "No new words to save - you already know all the vocabulary!"
 
         # Estimate processing time
         # Word analysis uses TRANSLATE_MODEL (translategemma:4b) - fast and accurate
-        # Approximately 5-10 seconds per batch of 20 words on typical hardware
+        # Approximately 5-10 seconds per batch of 20 words on typical hardware,
+        # with WORD_ANALYSIS_WORKERS batches in flight at once
         num_words = len(result.new_words_details)
         batch_size = 20
         num_batches = (num_words + batch_size - 1) // batch_size
-        estimated_seconds = num_batches * 8  # Average 8 seconds per batch for TranslateGemma 4B
+        batch_rounds = -(-num_batches // WORD_ANALYSIS_WORKERS)
+        estimated_seconds = batch_rounds * 8  # Average 8 seconds per batch for TranslateGemma 4B
 
         if estimated_seconds < 60:
             time_str = f"{int(estimated_seconds)}s"
@@ -1188,7 +1579,8 @@ def save_analysis_as_package(name: str, text: str, progress=gr.Progress()):
             # Map batch progress to 0.1-0.9 range (leave 0-0.1 and 0.9-1.0 for other steps)
             progress_value = 0.1 + (current_batch / total_batches) * 0.8
             remaining_batches = total_batches - current_batch
-            remaining_seconds = int(remaining_batches * 8)  # 8 seconds per batch (TranslateGemma 4B)
+            remaining_rounds = -(-remaining_batches // WORD_ANALYSIS_WORKERS)
+            remaining_seconds = int(remaining_rounds * 8)  # 8 seconds per batch (TranslateGemma 4B)
             if remaining_seconds > 0:
                 if remaining_seconds < 60:
                     time_remaining = f"{remaining_seconds}s"
@@ -1243,29 +1635,48 @@ def save_analysis_as_package(name: str, text: str, progress=gr.Progress()):
         return f"Error saving package: {str(e)}"
 
 
+# The package table and the package dropdown share one query, re-run only
+# after a database write
+_packages_cache = (None, None)  # (packages, data_version)
+
+
+def _recent_content_packages():
+    """Most recent content packages (served from cache until the data changes)"""
+    global _packages_cache
+    packages, version = _packages_cache
+    if packages is not None and version == get_data_version():
+        return packages
+    version = get_data_version()  # Read first so a concurrent write marks the result stale
+    packages = get_content_packages()
+    _packages_cache = (packages, version)
+    return packages
+
+
 def get_packages_display():
     """Get display of saved content packages."""
-    packages = get_content_packages(limit=10)
+    packages = _recent_content_packages()[:10]
 
     if not packages:
         return "No content packages saved yet. Analyze some text and save it to create your first package!"
 
-    md = "## Your Content Packages\n\n"
-    md += "| Name | New Words | Comprehension | Created |\n"
-    md += "|------|-----------|---------------|--------|\n"
+    parts = [
+        "## Your Content Packages\n\n",
+        "| Name | New Words | Comprehension | Created |\n",
+        "|------|-----------|---------------|--------|\n",
+    ]
 
     for pkg in packages:
         new_words = pkg.get('new_words_count', 0)
         comp_pct = pkg.get('comprehension_pct', 0)
         created = pkg.get('created_at', '')[:10]  # Just the date
-        md += f"| {pkg['name']} | {new_words} | {comp_pct:.0f}% | {created} |\n"
+        parts.append(f"| {pkg['name']} | {new_words} | {comp_pct:.0f}% | {created} |\n")
 
-    return md
+    return ''.join(parts)
 
 
 def get_package_choices():
     """Get packages as dropdown choices."""
-    packages = get_content_packages()
+    packages = _recent_content_packages()
     if not packages:
         return []
     return [(f"{pkg['name']} ({pkg.get('new_words_count', 0)} new words)", pkg['id']) for pkg in packages]
@@ -1279,6 +1690,8 @@ def add_words_from_package(package_selection):
     try:
         package_id = package_selection  # This is the ID from the dropdown value
         added, skipped_count, skipped = add_package_words_to_vocabulary(package_id)
+        if added:
+            schedule_prerender()  # Have the new words' audio ready before they come up for review
 
         # Build status message
         msg = f"✅ Added {added} new words to your vocabulary!"
@@ -1299,12 +1712,23 @@ def add_words_from_package(package_selection):
 def create_app():
     """Create the Gradio application"""
 
+    # Concurrency groups for the request queue: Whisper shares one model, so it
+    # runs one request at a time; TTS is network-bound; LLM calls match the
+    # number of requests Ollama serves in parallel (its OLLAMA_NUM_PARALLEL)
+    WHISPER_EVENT = dict(concurrency_limit=1, concurrency_id="whisper")
+    TTS_EVENT = dict(concurrency_limit=16, concurrency_id="tts")
+    LLM_EVENT = dict(concurrency_limit=int(os.environ.get("OLLAMA_NUM_PARALLEL", 2)), concurrency_id="llm")
+
     with gr.Blocks(
         title="HablaConmigo - Learn Spanish"
     ) as app:
 
         gr.Markdown("# 🇪🇸 HablaConmigo - Learn Spanish")
 
+        # Per-session practice queue shared by the Home and Vocabulary tabs
+        vocab_queue_state = gr.State([])
+        practice_offset_state = gr.State(dict(PRACTICE_OFFSETS_START))
+
         with gr.Tabs():
 
             # ============ Learning Path Tab (HOME) ============
@@ -1336,19 +1760,24 @@ def create_app():
                     refresh_path_btn = gr.Button("Refresh Path")
 
                 # Event handlers
-                refresh_home_btn.click(get_ai_coach_display, outputs=[ai_coach_display])
-                refresh_home_btn.click(get_xp_display, outputs=[xp_display])
-                refresh_home_btn.click(get_pipeline_display, outputs=[pipeline_display])
+                refresh_home_btn.click(refresh_home_displays, outputs=[ai_coach_display, xp_display, pipeline_display])
                 refresh_path_btn.click(get_learning_path_display, outputs=[learning_path_display])
                 learn_new_btn.click(get_new_words_display, outputs=[new_words_display])
-                practice_struggling_btn.click(load_struggling_words, outputs=[practice_queue_status])
-                practice_learning_btn.click(load_learning_words, outputs=[practice_queue_status])
+                practice_struggling_btn.click(
+                    load_struggling_words,
+                    inputs=[vocab_queue_state, practice_offset_state],
+                    outputs=[practice_queue_status, vocab_queue_state, practice_offset_state]
+                )
+                practice_learning_btn.click(
+                    load_learning_words,
+                    inputs=[vocab_queue_state, practice_offset_state],
+                    outputs=[practice_queue_status, vocab_queue_state, practice_offset_state]
+                )
 
                 # Load on startup
-                app.load(get_ai_coach_display, outputs=[ai_coach_display])
-                app.load(get_xp_display, outputs=[xp_display])
-                app.load(get_pipeline_display, outputs=[pipeline_display])
+                app.load(refresh_home_displays, outputs=[ai_coach_display, xp_display, pipeline_display])
                 app.load(get_learning_path_display, outputs=[learning_path_display])
+                app.load(schedule_prefetch)  # Start rendering phrase audio in the background
 
             # ============ Speaking Practice Tab ============
             with gr.Tab("🎤 Speaking Practice"):
@@ -1368,29 +1797,53 @@ def create_app():
 
                 with gr.Row():
                     phrase_audio = gr.Audio(label="Native", type="filepath", autoplay=True, scale=1)
-                    user_recording = gr.Audio(label="Your Recording (auto-evaluates when done)", sources=["microphone"], type="filepath", scale=1)
+                    user_recording = gr.Audio(
+                        label="Your Recording (auto-evaluates when done)", sources=["microphone"],
+                        type="numpy", streaming=True, scale=1
+                    )
 
                 with gr.Row():
                     accuracy_score = gr.Number(label="Accuracy", value=0, scale=1)
                     word_comparison = gr.Textbox(label="Word Analysis", lines=2, scale=2)
                     feedback_text = gr.Textbox(label="Feedback", lines=2, scale=2)
 
+                # Per-session state (each browser tab gets its own copy)
+                phrase_state = gr.State(None)
+                stats_state = gr.State({"attempts": 0, "total_accuracy": 0})
+                recording_stream = gr.State(None)
+                attempt_state = gr.State(None)  # Scored attempt awaiting LLM feedback
+
                 # Event handlers
                 new_phrase_btn.click(
                     get_random_phrase,
-                    inputs=[category_select, voice_select],
-                    outputs=[spanish_phrase, english_phrase, phrase_notes, phrase_audio, user_recording]
+                    inputs=[category_select, voice_select, phrase_state],
+                    outputs=[spanish_phrase, english_phrase, phrase_notes, phrase_audio, user_recording, phrase_state],
+                    **TTS_EVENT
                 )
                 play_btn.click(
                     play_phrase_audio,
                     inputs=[spanish_phrase, voice_select],
-                    outputs=[phrase_audio]
+                    outputs=[phrase_audio],
+                    **TTS_EVENT
+                )
+                # Transcribe while recording, then auto-evaluate when the user stops
+                user_recording.start_recording(new_transcription_stream, outputs=[recording_stream])
+                user_recording.stream(
+                    transcribe_recording_chunk,
+                    inputs=[user_recording, recording_stream],
+                    outputs=[recording_stream],
+                    **WHISPER_EVENT
                 )
-                # Auto-evaluate when recording changes (user stops recording)
-                user_recording.change(
+                user_recording.stop_recording(
                     evaluate_pronunciation,
-                    inputs=[user_recording, spanish_phrase],
-                    outputs=[feedback_text, word_comparison, accuracy_score]
+                    inputs=[recording_stream, spanish_phrase, phrase_state, stats_state],
+                    outputs=[feedback_text, word_comparison, accuracy_score, stats_state, attempt_state],
+                    **WHISPER_EVENT
+                ).then(
+                    explain_pronunciation_attempt,
+                    inputs=[attempt_state, feedback_text],
+                    outputs=[feedback_text],
+                    **LLM_EVENT
                 )
 
             # ============ Conversation Tab ============
@@ -1418,42 +1871,48 @@ def create_app():
                     send_btn = gr.Button("Send", variant="primary", scale=1)
 
                 with gr.Row():
-                    voice_input = gr.Audio(label="Voice input", sources=["microphone"], type="filepath", scale=2)
+                    voice_input = gr.Audio(label="Voice input", sources=["microphone"], type="numpy", scale=2)
                     transcribe_btn = gr.Button("Transcribe", scale=1)
 
-                response_audio = gr.Audio(label="AI Response", type="filepath", autoplay=True)
+                response_audio = gr.Audio(label="AI Response", type="filepath", autoplay=True, streaming=True)
 
                 # Event handlers
                 send_btn.click(
                     chat_with_ai,
                     inputs=[user_input, chatbot, conv_voice_select],
-                    outputs=[chatbot, user_input, response_audio]
+                    outputs=[chatbot, user_input, response_audio],
+                    **LLM_EVENT
                 )
                 user_input.submit(
                     chat_with_ai,
                     inputs=[user_input, chatbot, conv_voice_select],
-                    outputs=[chatbot, user_input, response_audio]
+                    outputs=[chatbot, user_input, response_audio],
+                    **LLM_EVENT
                 )
                 clear_btn.click(clear_conversation, outputs=[chatbot, user_input, suggestion_text])
                 transcribe_btn.click(
                     transcribe_voice_input,
                     inputs=[voice_input],
-                    outputs=[user_input]
+                    outputs=[user_input],
+                    **WHISPER_EVENT
                 )
                 speak_response_btn.click(
                     speak_ai_response,
                     inputs=[chatbot],
-                    outputs=[response_audio]
+                    outputs=[response_audio],
+                    **TTS_EVENT
                 )
                 translate_btn.click(
                     translate_last_response,
                     inputs=[chatbot],
-                    outputs=[chatbot]
+                    outputs=[chatbot],
+                    **LLM_EVENT
                 )
                 suggest_btn.click(
                     suggest_next_response,
                     inputs=[chatbot],
-                    outputs=[chatbot, suggestion_text]
+                    outputs=[chatbot, suggestion_text],
+                    **LLM_EVENT
                 )
 
             # ============ Listening Tab ============
@@ -1483,7 +1942,8 @@ def create_app():
                 new_listen_btn.click(
                     generate_listening_exercise,
                     inputs=[listen_category],
-                    outputs=[listen_audio, correct_spanish, correct_english, user_answer]
+                    outputs=[listen_audio, correct_spanish, correct_english, user_answer],
+                    **TTS_EVENT
                 )
                 check_btn.click(
                     check_listening_answer,
@@ -1506,7 +1966,8 @@ def create_app():
                     vocab_english = gr.Textbox(label="English", interactive=False, scale=1)
                     vocab_example = gr.Textbox(label="Example", interactive=False, scale=1)
 
-                vocab_id = gr.Number(visible=False)
+                vocab_id = gr.State(None)  # Current word id (server-side only)
+                vocab_item_state = gr.State(None)
                 vocab_audio = gr.Audio(label="Pronunciation", type="filepath", autoplay=True)
 
                 # Help me remember feature
@@ -1532,41 +1993,50 @@ def create_app():
                 # Event handlers
                 get_vocab_btn.click(
                     get_vocab_for_review,
-                    outputs=[vocab_spanish, vocab_english, vocab_id, vocab_example, vocab_audio]
+                    inputs=[vocab_queue_state],
+                    outputs=[vocab_spanish, vocab_english, vocab_id, vocab_example, vocab_audio, vocab_item_state, vocab_queue_state],
+                    **TTS_EVENT
                 )
                 vocab_audio_btn.click(
                     play_vocab_audio,
                     inputs=[vocab_spanish],
-                    outputs=[vocab_audio]
+                    outputs=[vocab_audio],
+                    **TTS_EVENT
                 )
                 reveal_btn.click(
                     reveal_vocab_translation,
+                    inputs=[vocab_item_state],
                     outputs=[vocab_english, vocab_example]
                 )
                 help_remember_btn.click(
                     help_me_remember,
                     inputs=[vocab_id],
-                    outputs=[memory_image, memory_sentence, memory_sentence_english, memory_audio, memory_info]
+                    outputs=[memory_image, memory_sentence, memory_sentence_english, memory_audio, memory_info],
+                    **LLM_EVENT
                 )
                 btn_known.click(
-                    lambda vid: submit_vocab_review(vid, 5),
-                    inputs=[vocab_id],
-                    outputs=[vocab_spanish, vocab_english, vocab_id, vocab_example, vocab_audio]
+                    lambda vid, queue: submit_vocab_review(vid, 5, queue),
+                    inputs=[vocab_id, vocab_queue_state],
+                    outputs=[vocab_spanish, vocab_english, vocab_id, vocab_example, vocab_audio, vocab_item_state, vocab_queue_state],
+                    **TTS_EVENT
                 )
                 btn_again.click(
-                    lambda vid: submit_vocab_review(vid, 0),
-                    inputs=[vocab_id],
-                    outputs=[vocab_spanish, vocab_english, vocab_id, vocab_example, vocab_audio]
+                    lambda vid, queue: submit_vocab_review(vid, 0, queue),
+                    inputs=[vocab_id, vocab_queue_state],
+                    outputs=[vocab_spanish, vocab_english, vocab_id, vocab_example, vocab_audio, vocab_item_state, vocab_queue_state],
+                    **TTS_EVENT
                 )
                 delete_vocab_btn.click(
                     delete_current_vocab,
-                    inputs=[vocab_id],
-                    outputs=[delete_status, vocab_spanish, vocab_english, vocab_id, vocab_example, vocab_audio]
+                    inputs=[vocab_id, vocab_queue_state],
+                    outputs=[delete_status, vocab_spanish, vocab_english, vocab_id, vocab_example, vocab_audio, vocab_item_state, vocab_queue_state],
+                    **TTS_EVENT
                 )
                 lookup_btn.click(
                     get_vocab_help,
                     inputs=[lookup_word],
-                    outputs=[lookup_result]
+                    outputs=[lookup_result],
+                    **LLM_EVENT
                 )
 
             # ============ Grammar Tab ============
@@ -1579,7 +2049,8 @@ def create_app():
                 grammar_btn.click(
                     explain_phrase_grammar,
                     inputs=[grammar_input],
-                    outputs=[grammar_output]
+                    outputs=[grammar_output],
+                    **LLM_EVENT
                 )
 
             # ============ Statistics Tab ============
@@ -1648,6 +2119,8 @@ def create_app():
                             """Add missing DELE vocabulary and return status."""
                             summary_before = get_dele_vocabulary_summary(level)
                             added, skipped, topics = add_missing_dele_vocabulary(level)
+                            if added:
+                                schedule_prerender()
 
                             if added == 0 and skipped == 0:
                                 return f"✅ **Great!** You already have all DELE {level} vocabulary!"
@@ -1729,7 +2202,7 @@ Go to the **Vocabulary** tab to start learning these words!"""
 
                     summary = get_grammar_progress_summary()
 
-                    output = f"""### Progress Summary
+                    parts = [f"""### Progress Summary
 
 **Total Topics:** {summary['total_topics']}
 - ✅ **Mastered:** {summary.get('mastered', 0)}
@@ -1738,17 +2211,17 @@ Go to the **Vocabulary** tab to start learning these words!"""
 - ⭕ **New:** {summary.get('new', 0)}
 
 #### By CEFR Level:
-"""
+"""]
                     for level, data in summary['by_level'].items():
-                        bar = "█" * int(data['percentage'] / 10) + "░" * (10 - int(data['percentage'] / 10))
-                        output += f"\n**{level}:** {data['mastered']}/{data['total']} ({data['percentage']}%) {bar}"
+                        bar = score_bar(data['percentage'])
+                        parts.append(f"\n**{level}:** {data['mastered']}/{data['total']} ({data['percentage']}%) {bar}")
 
-                    output += "\n\n#### By Category:\n"
+                    parts.append("\n\n#### By Category:\n")
                     for category, data in summary['by_category'].items():
-                        bar = "█" * int(data['percentage'] / 10) + "░" * (10 - int(data['percentage'] / 10))
-                        output += f"\n**{category.title()}:** {data['mastered']}/{data['total']} ({data['percentage']}%) {bar}"
+                        bar = score_bar(data['percentage'])
+                        parts.append(f"\n**{category.title()}:** {data['mastered']}/{data['total']} ({data['percentage']}%) {bar}")
 
-                    return output
+                    return ''.join(parts)
 
                 def display_grammar_topics(level_filter):
                     """Display grammar topics with progress"""
@@ -1840,7 +2313,8 @@ Go to the **Vocabulary** tab to start learning these words!"""
 
                 generate_forms_btn.click(
                     generate_word_forms_ui,
-                    outputs=[generation_status]
+                    outputs=[generation_status],
+                    **LLM_EVENT
                 ).then(
                     display_word_forms_info,
                     outputs=[word_forms_info]
@@ -1909,7 +2383,14 @@ Import Spanish content from YouTube videos, websites, files, or paste text direc
 
                 with gr.Row():
                     with gr.Column():
-                        new_words_display = gr.Markdown()
+                        new_words_display = gr.Dataframe(
+                            label="New Words to Learn",
+                            headers=["Word", "Translation", "Level", "Frequency", "DELE A2"],
+                            datatype=["str", "str", "str", "number", "str"],
+                            column_count=(5, "fixed"),
+                            interactive=False,
+                            wrap=True
+                        )
 
                 with gr.Row():
                     priority_words_display = gr.Markdown()
@@ -1957,18 +2438,19 @@ Import Spanish content from YouTube videos, websites, files, or paste text direc
                         gr.update(value=None, visible=False),  # file_input
                         gr.update(value="", visible=True),  # content_input
                         "",  # analysis_summary
-                        "",  # new_words_display
+                        [],  # new_words_display
                         "",  # priority_words_display
                         gr.update(visible=False),  # save_row
                         "",  # save_status
                         gr.update(visible=False, value=""),  # extracted_preview
+                        "",  # analyzed_text_state
                     )
 
                 clear_btn.click(
                     clear_all,
                     outputs=[source_type, url_input, file_input, content_input, analysis_summary,
                              new_words_display, priority_words_display, save_row, save_status,
-                             extracted_preview]
+                             extracted_preview, analyzed_text_state]
                 )
 
                 save_package_btn.click(
@@ -2283,10 +2765,19 @@ if __name__ == "__main__":
         print(f"Fixed {fixed} vocabulary words with missing translations")
 
     app = create_app()
+    # Handlers no longer share module globals, so requests can run in parallel;
+    # per-event limits (see create_app) cap Whisper, TTS and LLM separately and
+    # everything else (DB reads, Markdown builders) shares the default limit
+    app.queue(default_concurrency_limit=16, max_size=128)
     app.launch(
         server_name="127.0.0.1",
         server_port=port,
         share=False,
+        max_threads=64,
+        # Gradio only serves returned files from the working dir, the temp dir
+        # and allowed_paths; TTS_CACHE_DIR can be set anywhere, and the baked
+        # clips are only under the working dir when launched from the repo root
+        allowed_paths=[str(TTS_CACHE_DIR), str(TTS_BAKED_DIR)],
         theme=gr.themes.Soft(
             primary_hue="violet",
             secondary_hue="slate",
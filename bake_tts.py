@@ -0,0 +1,57 @@
+"""
+Bake TTS Audio
+Renders every phrase (both voices) and vocabulary word (female voice) to
+data/tts/ so a deployment ships with its audio and never calls Edge TTS
+for built-in content. Already-baked clips are skipped, so re-running after
+adding content only renders the new items.
+
+Usage: python bake_tts.py
+"""
+from concurrent.futures import ThreadPoolExecutor
+
+from src.audio import text_to_speech, baked_tts_path, TTS_BAKED_DIR
+from src.content import populate_database
+from src.database import get_phrases, get_all_vocabulary
+
+BAKE_WORKERS = 16  # Edge TTS is network-bound
+
+
+def bake_item(item) -> bool:
+    """Render one (text, voice) clip into the baked directory"""
+    text, voice = item
+    path = baked_tts_path(text, voice)
+    tmp_path = path.with_suffix(".tmp")
+    try:
+        text_to_speech(text, voice, output_path=str(tmp_path))
+        tmp_path.replace(path)
+        return True
+    except Exception as e:
+        print(f"  [FAILED] {voice}: {text} ({e})")
+        if tmp_path.exists():
+            tmp_path.unlink()
+        return False
+
+
+def main():
+    populate_database()
+
+    phrases = get_phrases()
+    vocab = get_all_vocabulary()
+
+    items = [(p['spanish'], voice) for p in phrases for voice in ("female", "male")]
+    items += [(w['spanish'], "female") for w in vocab]
+    items = list(dict.fromkeys(items))  # Some vocabulary doubles as a phrase
+    todo = [item for item in items if not baked_tts_path(*item).exists()]
+
+    print(f"Baking TTS audio into {TTS_BAKED_DIR}")
+    print(f"  {len(items)} clips total, {len(items) - len(todo)} already baked, {len(todo)} to render")
+
+    TTS_BAKED_DIR.mkdir(parents=True, exist_ok=True)
+    with ThreadPoolExecutor(max_workers=BAKE_WORKERS) as pool:
+        rendered = sum(pool.map(bake_item, todo))
+
+    print(f"\n[SUCCESS] Rendered {rendered}/{len(todo)} clips")
+
+
+if __name__ == "__main__":
+    main()
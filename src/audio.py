@@ -1,11 +1,15 @@
 """
 Audio module for Spanish Learning App
-Handles Speech-to-Text (Whisper) and Text-to-Speech (Edge TTS)
+Handles Speech-to-Text (faster-whisper) and Text-to-Speech (Edge TTS)
 """
 
 import asyncio
+import hashlib
 import tempfile
 import os
+import re
+import threading
+import time
 from pathlib import Path
 import sys
 
@@ -40,64 +44,281 @@ def _setup_ffmpeg():
 _setup_ffmpeg()
 
 import edge_tts
-import whisper
-import soundfile as sf
 import numpy as np
+from rapidfuzz.distance import Levenshtein
 
 # Whisper model (loaded lazily)
 _whisper_model = None
+_whisper_model_lock = threading.Lock()  # Background warm-up and first request may race
+_batched_pipeline = None
+
+# Chunks decoded together by the batched pipeline (longer free-form recordings)
+WHISPER_BATCH_SIZE = 16
+
+# Whisper works on 16 kHz mono float32 audio
+WHISPER_SAMPLE_RATE = 16000
+
+
+# Fastest precision first; the first one CTranslate2 supports on the device wins
+WHISPER_COMPUTE_PREFERENCE = {
+    "cuda": ("int8_float16", "float16", "int8", "float32"),
+    "cpu": ("int8", "float32"),
+}
+
+
+def _whisper_device() -> tuple:
+    """
+    Pick (device, compute_type) for faster-whisper: INT8 weights with FP16
+    activations on CUDA, INT8 on CPU, falling back to what the hardware supports.
+
+    Override with WHISPER_DEVICE / WHISPER_COMPUTE_TYPE in .env
+    (e.g. WHISPER_COMPUTE_TYPE=float16 for full FP16 weights on the GPU).
+    """
+    import ctranslate2
+
+    device = os.environ.get("WHISPER_DEVICE")
+    if device is None:
+        device = "cuda" if ctranslate2.get_cuda_device_count() > 0 else "cpu"
+
+    compute_type = os.environ.get("WHISPER_COMPUTE_TYPE")
+    if compute_type is None:
+        supported = ctranslate2.get_supported_compute_types(device)
+        preference = WHISPER_COMPUTE_PREFERENCE.get(device, ("default",))
+        compute_type = next((ct for ct in preference if ct in supported), "default")
+
+    return device, compute_type
+
 
 def get_whisper_model(model_size: str = "base"):
     """Load Whisper model (cached)"""
     global _whisper_model
-    if _whisper_model is None:
-        print(f"Loading Whisper {model_size} model...")
-        _whisper_model = whisper.load_model(model_size)
+    with _whisper_model_lock:
+        if _whisper_model is None:
+            device, compute_type = _whisper_device()
+            print(f"Loading Whisper {model_size} model ({device}, {compute_type})...")
+            try:
+                _whisper_model = _load_whisper_model(model_size, device, compute_type)
+            except (RuntimeError, ValueError) as e:
+                if device == "cpu":
+                    raise
+                # e.g. CUDA visible but cuDNN/cuBLAS missing - stay usable on CPU
+                print(f"Whisper could not start on {device} ({e}), falling back to CPU")
+                _whisper_model = _load_whisper_model(model_size, "cpu", "int8")
     return _whisper_model
 
 
-def transcribe_audio(audio_path: str, language: str = "es") -> dict:
+def _load_whisper_model(model_size: str, device: str, compute_type: str):
+    """Construct a faster-whisper model for a device/precision"""
+    # Imported here: faster-whisper and CTranslate2 are heavy to import, and
+    # the model is loaded on the background preload thread, off app startup
+    from faster_whisper import WhisperModel
+
+    return WhisperModel(
+        model_size,
+        device=device,
+        compute_type=compute_type,
+        cpu_threads=os.cpu_count() or 4,
+        num_workers=1,
+    )
+
+
+def get_batched_whisper_pipeline():
+    """Batched pipeline over the shared Whisper model (VAD-split chunks decoded together)"""
+    global _batched_pipeline
+    from faster_whisper import BatchedInferencePipeline
+
+    model = get_whisper_model()
+    with _whisper_model_lock:
+        if _batched_pipeline is None:
+            _batched_pipeline = BatchedInferencePipeline(model=model)
+    return _batched_pipeline
+
+
+def transcribe_audio(audio_path, language: str = "es", max_chars: int = None, batch_size: int = None) -> dict:
     """
     Transcribe audio file to text using Whisper
 
     Args:
-        audio_path: Path to audio file
+        audio_path: Path to audio file (or 16 kHz float32 numpy array)
         language: Language code (default: Spanish)
+        max_chars: Stop decoding once this much text has been transcribed
+            (e.g. when only an expected phrase needs to be checked)
+        batch_size: Decode speech chunks in batches of this size with the
+            batched pipeline (worth it for longer, free-form recordings)
 
     Returns:
         dict with 'text', 'segments', 'language', and 'success' flag
     """
-    model = get_whisper_model()
-    result = model.transcribe(
-        audio_path,
-        language=language,
-        task="transcribe",
-        fp16=False,  # Better compatibility
-        verbose=False,
-    )
+    if batch_size:
+        segments, info = get_batched_whisper_pipeline().transcribe(
+            audio_path,
+            language=language,
+            task="transcribe",
+            beam_size=1,
+            vad_filter=True,                # Required: VAD splits the audio into the chunks to batch
+            batch_size=batch_size,
+        )
+    else:
+        segments, info = get_whisper_model().transcribe(
+            audio_path,
+            language=language,
+            task="transcribe",
+            beam_size=1,                    # Greedy decoding - short utterances don't need beam search
+            vad_filter=True,                # Skip leading/trailing silence
+            condition_on_previous_text=False,
+        )
+
+    # Segments is a lazy generator - decoding happens while we iterate, so
+    # breaking out early skips decoding the rest of the audio
+    segment_list = []
+    transcribed_chars = 0
+    for seg in segments:
+        segment_list.append({"id": seg.id, "start": seg.start, "end": seg.end, "text": seg.text})
+        transcribed_chars += len(seg.text.strip())
+        if max_chars is not None and transcribed_chars >= max_chars:
+            break
+    text = "".join(seg["text"] for seg in segment_list).strip()
+
+    return {
+        "text": text,
+        "segments": segment_list,
+        "language": info.language or language,
+        "success": _looks_like_transcription(text)
+    }
+
+
+# Cyrillic or CJK output means Whisper misheard the language
+NON_LATIN_PATTERN = re.compile(r'[а-яА-Яёё\u4e00-\u9fff\u3040-\u309f\u30a0-\u30ff]')
 
-    text = result["text"].strip()
-    success = True
 
-    # Check if transcription looks like non-Spanish (basic heuristic)
+def _looks_like_transcription(text: str) -> bool:
+    """Basic heuristic for whether Whisper actually understood the audio"""
     # If it contains Cyrillic or other non-Latin characters, it probably failed
-    import re
-    if re.search(r'[а-яА-Яёё\u4e00-\u9fff\u3040-\u309f\u30a0-\u30ff]', text):
-        success = False
+    if NON_LATIN_PATTERN.search(text):
+        return False
 
     # If transcription is empty or very short, it might have failed
     if len(text) < 2:
-        success = False
+        return False
+
+    return True
+
+
+def audio_to_whisper_array(sample_rate: int, data: np.ndarray) -> np.ndarray:
+    """
+    Convert raw microphone audio (as delivered by gr.Audio(type="numpy"))
+    to the 16 kHz mono float32 array Whisper expects.
+    """
+    data = np.asarray(data)
+    if np.issubdtype(data.dtype, np.integer):
+        data = data.astype(np.float32) / np.iinfo(data.dtype).max
+    else:
+        data = data.astype(np.float32, copy=False)
+
+    if data.ndim > 1:
+        data = data.mean(axis=1)
+
+    if sample_rate != WHISPER_SAMPLE_RATE and len(data) > 0:
+        # Linear resampling is plenty for speech recognition
+        target_len = int(len(data) * WHISPER_SAMPLE_RATE / sample_rate)
+        data = np.interp(
+            np.linspace(0, len(data) - 1, target_len),
+            np.arange(len(data)),
+            data,
+        ).astype(np.float32)
+
+    return data
+
+
+# ============ Streaming Transcription ============
+# While the user is still speaking we transcribe the audio that has arrived
+# so far. Segments that end well before the newest audio are "committed" and
+# never decoded again, so when recording stops only the last second or two
+# still needs work.
+
+STREAM_MIN_NEW_SECONDS = 1.0   # Wait for this much fresh audio before decoding
+STREAM_COMMIT_MARGIN = 1.0     # Segments ending this close to the tail may still change
+
+
+def new_transcription_stream() -> dict:
+    """Create empty state for a streaming transcription"""
+    return {
+        "audio": np.zeros(0, dtype=np.float32),
+        "committed_text": "",
+        "committed_samples": 0,
+        "decoded_samples": 0,
+    }
+
+
+def feed_transcription_stream(stream: dict, sample_rate: int, chunk: np.ndarray, language: str = "es") -> dict:
+    """
+    Append a microphone chunk and transcribe the uncommitted tail.
+
+    Args:
+        stream: State from new_transcription_stream()
+        sample_rate: Sample rate of the chunk
+        chunk: Raw audio samples
+        language: Language code
+
+    Returns:
+        Updated stream state
+    """
+    if stream is None:
+        stream = new_transcription_stream()
+
+    audio = np.concatenate([stream["audio"], audio_to_whisper_array(sample_rate, chunk)])
+    stream["audio"] = audio
+
+    new_samples = len(audio) - stream["decoded_samples"]
+    if new_samples < STREAM_MIN_NEW_SECONDS * WHISPER_SAMPLE_RATE:
+        return stream
+
+    start = stream["committed_samples"]
+    result = transcribe_audio(audio[start:], language)
+    stream["decoded_samples"] = len(audio)
+
+    # Commit segments that can no longer be affected by upcoming audio
+    tail_seconds = (len(audio) - start) / WHISPER_SAMPLE_RATE
+    for seg in result["segments"]:
+        if seg["end"] > tail_seconds - STREAM_COMMIT_MARGIN:
+            break
+        stream["committed_text"] += seg["text"]
+        stream["committed_samples"] = start + int(seg["end"] * WHISPER_SAMPLE_RATE)
+
+    return stream
+
+
+def finish_transcription_stream(stream: dict, language: str = "es", max_chars: int = None) -> dict:
+    """
+    Transcribe whatever audio is still uncommitted and return the full result
+
+    Args:
+        stream: State from new_transcription_stream()
+        language: Language code
+        max_chars: Stop decoding once the whole transcript reaches this length
+
+    Returns:
+        dict with 'text', 'language', and 'success' flag (same shape as transcribe_audio)
+    """
+    if stream is None or len(stream["audio"]) == 0:
+        return {"text": "", "segments": [], "language": language, "success": False}
+
+    tail = stream["audio"][stream["committed_samples"]:]
+    tail_budget = None if max_chars is None else max(1, max_chars - len(stream["committed_text"].strip()))
+    tail_text = transcribe_audio(tail, language, tail_budget)["text"] if len(tail) > 0 else ""
+    text = (stream["committed_text"] + " " + tail_text).strip()
+    text = " ".join(text.split())
 
     return {
         "text": text,
-        "segments": result.get("segments", []),
-        "language": result.get("language", language),
-        "success": success
+        "segments": [],
+        "language": language,
+        "success": _looks_like_transcription(text)
     }
 
 
-def transcribe_audio_from_array(audio_array: np.ndarray, sample_rate: int = 16000, language: str = "es") -> dict:
+def transcribe_audio_from_array(audio_array: np.ndarray, sample_rate: int = 16000, language: str = "es",
+                                batch_size: int = None) -> dict:
     """
     Transcribe audio from numpy array
 
@@ -105,21 +326,13 @@ def transcribe_audio_from_array(audio_array: np.ndarray, sample_rate: int = 1600
         audio_array: Audio data as numpy array
         sample_rate: Sample rate of audio
         language: Language code
+        batch_size: Use the batched pipeline with this batch size (see transcribe_audio)
 
     Returns:
         dict with transcription results
     """
-    # Save to temp file (Whisper expects file path)
-    with tempfile.NamedTemporaryFile(suffix=".wav", delete=False) as f:
-        temp_path = f.name
-        sf.write(temp_path, audio_array, sample_rate)
-
-    try:
-        result = transcribe_audio(temp_path, language)
-    finally:
-        os.unlink(temp_path)
-
-    return result
+    # faster-whisper takes arrays directly - no temp WAV round trip
+    return transcribe_audio(audio_to_whisper_array(sample_rate, audio_array), language, batch_size=batch_size)
 
 
 # Edge TTS voices for Castilian Spanish (Madrid)
@@ -136,23 +349,196 @@ async def _generate_speech_async(text: str, voice: str, output_path: str) -> str
     return output_path
 
 
+# ============ TTS Disk Cache ============
+# Vocabulary reviews and listening drills replay the same phrases constantly,
+# so generated audio is kept on disk keyed by a hash of (text, voice).
+
+# Defaults to the temp dir (RAM-backed under app.py on Linux); set TTS_CACHE_DIR
+# to a disk path to keep clips across reboots
+TTS_CACHE_DIR = Path(os.environ.get("TTS_CACHE_DIR") or Path(tempfile.gettempdir()) / "hablaconmigo_tts")
+TTS_CACHE_MAX_FILES = 5000                  # Room for every phrase (both voices) and vocabulary word
+TTS_CACHE_MAX_BYTES = int(os.environ.get("TTS_CACHE_MAX_MB", 200)) * 1024 * 1024  # Total size budget
+TTS_CACHE_MAX_AGE_DAYS = 30                 # Clips not played for this long are dropped
+TTS_CACHE_SWEEP_EVERY = 50                  # Re-check the budget every N new files
+
+# Clips rendered ahead of time by bake_tts.py (shipped with the app, never evicted)
+TTS_BAKED_DIR = Path(__file__).parent.parent / "data" / "tts"
+
+_tts_cache_writes = 0
+_tts_inflight = {}  # cache path -> Lock held while that clip is being synthesized
+_tts_inflight_lock = threading.Lock()
+
+
+def _tts_file_name(text: str, voice: str) -> str:
+    """File name for a (text, voice) clip, shared by the cache and baked audio"""
+    key = hashlib.blake2b(f"{voice}|{text}".encode("utf-8"), digest_size=16).hexdigest()
+    return f"{key}.mp3"
+
+
+def _tts_cache_path(text: str, voice: str) -> Path:
+    """Cache file location for a (text, voice) pair"""
+    return TTS_CACHE_DIR / _tts_file_name(text, voice)
+
+
+def baked_tts_path(text: str, voice_gender: str = "female") -> Path:
+    """Location of a pre-rendered clip for bake_tts.py (may not exist)"""
+    voice = SPANISH_VOICES.get(voice_gender, SPANISH_VOICES["female"])
+    return TTS_BAKED_DIR / _tts_file_name(text, voice)
+
+
+def sweep_tts_cache() -> int:
+    """
+    Trim the TTS cache: drop clips unused for TTS_CACHE_MAX_AGE_DAYS, then the
+    least recently used ones until it fits the file count and size budgets.
+    Also removes temp files left behind by interrupted writes.
+
+    Returns:
+        Number of clips removed
+    """
+    if not TTS_CACHE_DIR.exists():
+        return 0
+
+    now = time.time()
+    clips = []
+    for path in TTS_CACHE_DIR.iterdir():
+        try:
+            stat = path.stat()
+        except OSError:
+            continue  # Removed by another request meanwhile
+        if path.suffix == ".mp3":
+            clips.append((stat.st_mtime, stat.st_size, path))
+        elif path.suffix == ".tmp" and now - stat.st_mtime > 3600:
+            path.unlink(missing_ok=True)
+
+    clips.sort()  # Oldest (least recently used) first
+    total_bytes = sum(size for _, size, _ in clips)
+    max_age = TTS_CACHE_MAX_AGE_DAYS * 86400
+
+    removed = 0
+    for mtime, size, path in clips:
+        over_budget = (len(clips) - removed > TTS_CACHE_MAX_FILES
+                       or total_bytes > TTS_CACHE_MAX_BYTES)
+        if not over_budget and now - mtime < max_age:
+            break
+        path.unlink(missing_ok=True)
+        total_bytes -= size
+        removed += 1
+
+    if removed:
+        # Pre-render markers no longer describe a complete cache
+        for marker in TTS_CACHE_DIR.glob("__warmed_*"):
+            marker.unlink(missing_ok=True)
+
+    return removed
+
+
+def _evict_tts_cache():
+    """Run a cache sweep every TTS_CACHE_SWEEP_EVERY new files"""
+    global _tts_cache_writes
+    _tts_cache_writes += 1
+    if _tts_cache_writes % TTS_CACHE_SWEEP_EVERY == 0:
+        sweep_tts_cache()
+
+
 def text_to_speech(text: str, voice_gender: str = "female", output_path: str = None) -> str:
     """
     Convert text to speech using Edge TTS with Madrid Spanish voice
 
+    Results are cached on disk, so repeated phrases don't hit the network.
+
     Args:
         text: Spanish text to convert
         voice_gender: "male" or "female"
-        output_path: Optional path for output file
+        output_path: Optional path for output file (bypasses the cache)
+
+    Returns:
+        Path to generated audio file
+    """
+    voice = SPANISH_VOICES.get(voice_gender, SPANISH_VOICES["female"])
+
+    if output_path is not None:
+        _run_tts(text, voice, output_path)
+        return output_path
+
+    baked_path = TTS_BAKED_DIR / _tts_file_name(text, voice)
+    if baked_path.exists():
+        return str(baked_path)
+
+    cache_path = _tts_cache_path(text, voice)
+    if _tts_cache_hit(cache_path):
+        return str(cache_path)
+
+    # One synthesis per clip: a request for a clip that is already being
+    # rendered (prefetch, pre-render, a double click) waits for that result
+    with _tts_inflight_lock:
+        clip_lock = _tts_inflight.setdefault(cache_path, threading.Lock())
+    try:
+        with clip_lock:
+            if _tts_cache_hit(cache_path):
+                return str(cache_path)
+
+            # Write to a temp file first and rename, so concurrent requests never
+            # see a half-written mp3
+            tmp_path = _new_tts_tmp_path()
+            try:
+                _run_tts(text, voice, tmp_path)
+                os.replace(tmp_path, cache_path)
+            except Exception:
+                if os.path.exists(tmp_path):
+                    os.unlink(tmp_path)
+                raise
+    finally:
+        with _tts_inflight_lock:
+            if _tts_inflight.get(cache_path) is clip_lock and not clip_lock.locked():
+                del _tts_inflight[cache_path]
+
+    _evict_tts_cache()
+    return str(cache_path)
+
+
+async def text_to_speech_async(text: str, voice_gender: str = "female") -> str:
+    """
+    Async version of text_to_speech for coroutine handlers. Cache hits are
+    answered on the event loop; a miss is rendered by text_to_speech in a
+    worker thread, so it shares the per-clip lock with the prefetcher and
+    pre-render instead of synthesizing the same clip a second time.
 
     Returns:
         Path to generated audio file
     """
     voice = SPANISH_VOICES.get(voice_gender, SPANISH_VOICES["female"])
 
-    if output_path is None:
-        output_path = tempfile.mktemp(suffix=".mp3")
+    baked_path = TTS_BAKED_DIR / _tts_file_name(text, voice)
+    if baked_path.exists():
+        return str(baked_path)
+
+    cache_path = _tts_cache_path(text, voice)
+    if _tts_cache_hit(cache_path):
+        return str(cache_path)
+
+    return await asyncio.to_thread(text_to_speech, text, voice_gender)
+
 
+def _tts_cache_hit(cache_path: Path) -> bool:
+    """Check the TTS disk cache, marking a hit as recently used for LRU eviction"""
+    try:
+        os.utime(cache_path)
+    except FileNotFoundError:
+        # Not cached, or swept between the caller's lookup and now
+        return False
+    return True
+
+
+def _new_tts_tmp_path() -> str:
+    """Reserve a temp file inside the cache directory for an in-progress clip"""
+    TTS_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(suffix=".tmp", dir=TTS_CACHE_DIR)
+    os.close(fd)
+    return tmp_path
+
+
+def _run_tts(text: str, voice: str, output_path: str):
+    """Run the async Edge TTS call from synchronous code"""
     # Handle potential nested event loop issues on Windows
     try:
         loop = asyncio.get_event_loop()
@@ -168,7 +554,29 @@ def text_to_speech(text: str, voice_gender: str = "female", output_path: str = N
         # No event loop, create one
         asyncio.run(_generate_speech_async(text, voice, output_path))
 
-    return output_path
+
+def warm_up_audio():
+    """
+    Run a dummy clip through transcription and TTS so the first real
+    request doesn't pay for model warm-up and the first edge-tts connection.
+    """
+    # 2 seconds of 16 kHz silence straight into the model (no temp file).
+    # VAD is off: it would strip the whole silent clip and nothing would be
+    # decoded. The segments are lazy, so consume them to run the encoder and
+    # decoder; the batched pipeline (conversation voice input) is warmed too.
+    silence = np.zeros(WHISPER_SAMPLE_RATE * 2, dtype=np.float32)
+    segments, _ = get_whisper_model().transcribe(
+        silence, language="es", beam_size=1, vad_filter=False)
+    list(segments)
+    segments, _ = get_batched_whisper_pipeline().transcribe(
+        silence, language="es", beam_size=1, vad_filter=False, batch_size=WHISPER_BATCH_SIZE)
+    list(segments)
+
+    try:
+        text_to_speech("hola", "female")
+    except Exception as e:
+        # TTS needs network access - don't block startup if it's unavailable
+        print(f"TTS warm-up skipped: {e}")
 
 
 async def _get_voices_async():
@@ -184,6 +592,23 @@ def list_spanish_voices():
     return spanish_voices
 
 
+# Spanish number words to digits, so "seis" and "6" compare equal
+NUMBER_WORDS = {
+    'cero': '0', 'uno': '1', 'una': '1', 'dos': '2', 'tres': '3',
+    'cuatro': '4', 'cinco': '5', 'seis': '6', 'siete': '7',
+    'ocho': '8', 'nueve': '9', 'diez': '10', 'once': '11',
+    'doce': '12', 'trece': '13', 'catorce': '14', 'quince': '15',
+    'dieciséis': '16', 'dieciseis': '16', 'diecisiete': '17',
+    'dieciocho': '18', 'diecinueve': '19', 'veinte': '20',
+    'veintiuno': '21', 'veintidós': '22', 'veintidos': '22',
+    'treinta': '30', 'cuarenta': '40', 'cincuenta': '50',
+    'sesenta': '60', 'setenta': '70', 'ochenta': '80',
+    'noventa': '90', 'cien': '100', 'ciento': '100',
+}
+
+PUNCTUATION_PATTERN = re.compile(r'[^\w\s]')
+
+
 def compare_pronunciation(expected_text: str, spoken_text: str) -> dict:
     """
     Simple pronunciation comparison
@@ -195,77 +620,50 @@ def compare_pronunciation(expected_text: str, spoken_text: str) -> dict:
     Returns:
         dict with comparison results
     """
-    # Spanish number words to digits mapping
-    NUMBER_MAP = {
-        'cero': '0', 'uno': '1', 'una': '1', 'dos': '2', 'tres': '3',
-        'cuatro': '4', 'cinco': '5', 'seis': '6', 'siete': '7',
-        'ocho': '8', 'nueve': '9', 'diez': '10', 'once': '11',
-        'doce': '12', 'trece': '13', 'catorce': '14', 'quince': '15',
-        'dieciséis': '16', 'dieciseis': '16', 'diecisiete': '17',
-        'dieciocho': '18', 'diecinueve': '19', 'veinte': '20',
-        'veintiuno': '21', 'veintidós': '22', 'veintidos': '22',
-        'treinta': '30', 'cuarenta': '40', 'cincuenta': '50',
-        'sesenta': '60', 'setenta': '70', 'ochenta': '80',
-        'noventa': '90', 'cien': '100', 'ciento': '100',
-    }
-    # Reverse mapping (digits to words)
-    DIGIT_TO_WORD = {v: k for k, v in NUMBER_MAP.items()}
-
-    def normalize_word(word):
-        """Normalize a word, handling number equivalents"""
-        word = word.lower().strip()
-        # If it's a number word, return its digit equivalent for comparison
-        if word in NUMBER_MAP:
-            return NUMBER_MAP[word]
-        # If it's a digit, keep it as is
-        return word
-
-    # Normalize texts for comparison
-    expected_normalized = expected_text.lower().strip()
-    spoken_normalized = spoken_text.lower().strip()
-
-    # Remove punctuation for comparison
-    import re
-    expected_clean = re.sub(r'[^\w\s]', '', expected_normalized)
-    spoken_clean = re.sub(r'[^\w\s]', '', spoken_normalized)
-
-    # Word-level comparison
-    expected_words = expected_clean.split()
-    spoken_words = spoken_clean.split()
-
-    # Calculate accuracy
+    # Word-level comparison, on lowercased text without punctuation
+    expected_words = PUNCTUATION_PATTERN.sub('', expected_text.lower()).split()
+    spoken_words = PUNCTUATION_PATTERN.sub('', spoken_text.lower()).split()
+
+    # Compare normalized versions (handles numbers like "seis" vs "6")
+    expected_norm = [NUMBER_WORDS.get(w, w) for w in expected_words]
+    spoken_norm = [NUMBER_WORDS.get(w, w) for w in spoken_words]
+
+    # Align the word sequences with a word-level edit distance (RapidFuzz, C++)
+    # so a skipped or extra word doesn't push every later word out of place
     correct_words = 0
     word_results = []
 
-    for i, expected_word in enumerate(expected_words):
-        if i < len(spoken_words):
-            spoken_word = spoken_words[i]
-            # Compare normalized versions (handles numbers like "seis" vs "6")
-            expected_norm = normalize_word(expected_word)
-            spoken_norm = normalize_word(spoken_word)
-            is_correct = expected_norm == spoken_norm
-            if is_correct:
+    for tag, exp_start, exp_end, spk_start, spk_end in Levenshtein.opcodes(expected_norm, spoken_norm):
+        if tag == "equal":
+            for offset in range(exp_end - exp_start):
                 correct_words += 1
+                word_results.append({
+                    "expected": expected_words[exp_start + offset],
+                    "spoken": spoken_words[spk_start + offset],
+                    "correct": True,
+                    "similarity": 100
+                })
+            continue
+
+        # Pair replaced words up in order; leftovers are missing or extra words
+        for offset in range(max(exp_end - exp_start, spk_end - spk_start)):
+            exp_index = exp_start + offset
+            spk_index = spk_start + offset
+            expected_word = expected_words[exp_index] if exp_index < exp_end else None
+            spoken_word = spoken_words[spk_index] if spk_index < spk_end else None
+
+            # Character-level closeness of a mispronounced word (0-100)
+            similarity = 0
+            if expected_word and spoken_word:
+                similarity = round(Levenshtein.normalized_similarity(expected_word, spoken_word) * 100)
+
             word_results.append({
                 "expected": expected_word,
                 "spoken": spoken_word,
-                "correct": is_correct
-            })
-        else:
-            word_results.append({
-                "expected": expected_word,
-                "spoken": None,
-                "correct": False
+                "correct": False,
+                "similarity": similarity
             })
 
-    # Check for extra words spoken
-    for i in range(len(expected_words), len(spoken_words)):
-        word_results.append({
-            "expected": None,
-            "spoken": spoken_words[i],
-            "correct": False
-        })
-
     total_words = max(len(expected_words), len(spoken_words))
     accuracy = (correct_words / total_words * 100) if total_words > 0 else 0
 
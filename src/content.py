@@ -4,11 +4,19 @@ CEFR-aligned Spanish vocabulary and phrases organized by learning units
 Target: 500+ words for A1 level
 """
 
+import hashlib
+from pathlib import Path
+
 from src.database import (
     init_database, add_phrase, add_vocabulary, add_section, add_unit,
-    get_all_vocabulary, get_phrases, get_sections, get_units
+    get_all_vocabulary, get_phrases, get_sections, get_units,
+    get_setting, set_setting
 )
 
+# Fingerprint of this file's seed content; when the database already holds
+# this version, startup skips population entirely
+CONTENT_VERSION = hashlib.sha256(Path(__file__).read_bytes()).hexdigest()[:16]
+
 # ============================================================================
 # SECTION 1: A1.1 - Survival Basics (Target: 250 words)
 # ============================================================================
@@ -887,10 +895,15 @@ def populate_database():
     """Populate the database with initial content"""
     init_database()
 
+    # Seed content unchanged since the last run - nothing to do
+    if get_setting("content_version") == CONTENT_VERSION:
+        return
+
     # Check if already populated
     existing_vocab = get_all_vocabulary()
     if len(existing_vocab) > 50:
         print(f"Database already has {len(existing_vocab)} vocabulary items. Skipping population.")
+        set_setting("content_version", CONTENT_VERSION)
         return
 
     print("Populating database with CEFR-aligned content...")
@@ -944,6 +957,8 @@ def populate_database():
     print(f"  Total vocabulary: {total_vocab} words")
     print(f"  Total phrases: {total_phrases}")
 
+    set_setting("content_version", CONTENT_VERSION)
+
 
 if __name__ == "__main__":
     populate_database()
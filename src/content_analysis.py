@@ -14,6 +14,7 @@ Usage:
 
 import re
 import unicodedata
+from collections import Counter
 from dataclasses import dataclass, field
 from typing import List, Set, Dict, Optional, Tuple
 from datetime import datetime
@@ -533,9 +534,12 @@ def analyze_content(text: str, include_stop_words: bool = False) -> ContentAnaly
     tokens = tokenize_spanish(text)
     total_words = len(tokens)
 
-    # Lemmatize and get unique words
-    lemmas = [lemmatize_spanish(token) for token in tokens]
-    unique_lemmas = set(lemmas)
+    # Lemmatize each distinct token once and get unique words
+    # (long transcripts repeat the same few hundred tokens thousands of times)
+    lemma_of = {token: lemmatize_spanish(token) for token in set(tokens)}
+    lemmas = [lemma_of[token] for token in tokens]
+    all_lemmas = set(lemmas)
+    unique_lemmas = all_lemmas
 
     # Optionally filter out stop words
     if not include_stop_words:
@@ -588,18 +592,12 @@ def analyze_content(text: str, include_stop_words: bool = False) -> ContentAnaly
     sentences = extract_sentences(text)
 
     # Build detailed info for new words
-    word_counts = {}
-    for token in tokens:
-        lemma = lemmatize_spanish(token)
-        word_counts[lemma] = word_counts.get(lemma, 0) + 1
+    word_counts = Counter(lemmas)
 
     # Build a map from lemma to original tokens for context finding
     lemma_to_tokens = {}
-    for token in tokens:
-        lemma = lemmatize_spanish(token)
-        if lemma not in lemma_to_tokens:
-            lemma_to_tokens[lemma] = set()
-        lemma_to_tokens[lemma].add(token.lower())
+    for token, lemma in lemma_of.items():
+        lemma_to_tokens.setdefault(lemma, set()).add(token.lower())
 
     new_words_details = []
     for lemma in new_words:
@@ -642,7 +640,7 @@ def analyze_content(text: str, include_stop_words: bool = False) -> ContentAnaly
         comprehensible = len(total_known_unique) + len(learning_words)
         if not include_stop_words:
             # Add back stop words that were in the text
-            stop_in_text = len({lemmatize_spanish(t) for t in tokens} & STOP_WORDS)
+            stop_in_text = len(all_lemmas & STOP_WORDS)
             comprehensible += stop_in_text
             total_unique_with_stops = unique_count + stop_in_text
             comprehension_pct = (comprehensible / total_unique_with_stops) * 100
@@ -4,28 +4,140 @@ SQLite database for vocabulary, progress tracking, learning path, and session hi
 """
 
 import sqlite3
+import threading
 from datetime import datetime, timedelta
 from pathlib import Path
 from typing import Optional
 import json
+import re
 
 # Database path
 DB_PATH = Path(__file__).parent.parent / "data" / "hablaconmigo.db"
 
 
-def get_connection():
-    """Get database connection"""
+# Per-connection tuning (journal_mode=WAL is persistent and set in init_database)
+CONNECTION_PRAGMAS = (
+    "PRAGMA synchronous=NORMAL",     # Safe with WAL, avoids an fsync per commit
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA mmap_size=268435456",    # 256 MB memory-mapped reads
+    "PRAGMA cache_size=-65536",      # 64 MB page cache
+    "PRAGMA busy_timeout=5000",
+)
+
+# Each thread keeps one open connection and reuses it between calls
+_local = threading.local()
+
+# Bumped whenever a connection that wrote something is closed, so display
+# caches in the UI can tell whether what they rendered is stale
+_data_version = 0
+
+
+def get_data_version() -> int:
+    """Counter that changes after every database write"""
+    return _data_version
+
+
+class _TrackedConnection(sqlite3.Connection):
+    """Connection that bumps the data version on close() if it changed any rows"""
+    changes_at_checkout = 0
+
+    def _note_changes(self):
+        global _data_version
+        if self.total_changes != self.changes_at_checkout:
+            _data_version += 1
+            self.changes_at_checkout = self.total_changes
+
+    def close(self):
+        self._note_changes()
+        super().close()
+
+
+class _ReusableConnection(_TrackedConnection):
+    """
+    Connection that goes back to its thread's slot on close() instead of
+    closing, so callers keep the usual connect -> commit -> close pattern.
+    """
+    in_use = False
+
+    def close(self):
+        # Discard anything the caller didn't commit, like a real close would
+        if self.in_transaction:
+            self.rollback()
+        self._note_changes()
+        self.in_use = False
+
+
+class _Checkout:
+    """
+    One caller's handle on its thread's reusable connection.
+
+    close() hands the connection back. A handle dropped without close() -
+    the caller raised between get_connection() and close() - does the same
+    when it is garbage-collected, rolling back whatever it left uncommitted,
+    so a failed handler can't hold the write lock for the rest of the process.
+    """
+    __slots__ = ("_conn",)
+
+    def __init__(self, conn):
+        object.__setattr__(self, "_conn", conn)
+
+    def __getattr__(self, name):
+        return getattr(self._conn, name)
+
+    def __setattr__(self, name, value):
+        setattr(self._conn, name, value)
+
+    def __enter__(self):
+        # Like sqlite3.Connection: the with-block is a transaction (commit or
+        # roll back on exit), and the handle is not closed
+        self._conn.__enter__()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        return self._conn.__exit__(exc_type, exc_value, traceback)
+
+    def close(self):
+        conn = self._conn
+        if conn is not None:
+            object.__setattr__(self, "_conn", None)
+            conn.close()
+
+    __del__ = close
+
+
+def _open_connection(factory=_TrackedConnection):
     DB_PATH.parent.mkdir(parents=True, exist_ok=True)
-    conn = sqlite3.connect(str(DB_PATH))
+    conn = sqlite3.connect(str(DB_PATH), factory=factory, check_same_thread=False)
     conn.row_factory = sqlite3.Row
+    for pragma in CONNECTION_PRAGMAS:
+        conn.execute(pragma)
     return conn
 
 
+def get_connection():
+    """Get database connection (reuses this thread's connection when it's free)"""
+    conn = getattr(_local, "conn", None)
+    if conn is None or _local.path != DB_PATH:
+        conn = _open_connection(_ReusableConnection)
+        _local.conn = conn
+        _local.path = DB_PATH
+    elif conn.in_use:
+        # Nested call while the thread's connection is checked out -
+        # use a separate short-lived connection
+        return _open_connection()
+
+    conn.in_use = True
+    return _Checkout(conn)
+
+
 def init_database():
     """Initialize database tables"""
     conn = get_connection()
     cursor = conn.cursor()
 
+    # Write-ahead logging lets the UI keep reading while a review is written
+    cursor.execute("PRAGMA journal_mode=WAL")
+
     # ============ Learning Path Tables ============
 
     # Sections (CEFR levels - A1.1, A1.2, A2.1, etc.)
@@ -112,6 +224,11 @@ def init_database():
         )
     """)
     # status: 'new', 'learning', 'learned', 'due', 'struggling'
+    cursor.execute("CREATE INDEX IF NOT EXISTS idx_vocab_progress_next_review ON vocabulary_progress(next_review)")
+    # Progress rows are looked up by word on every review, join and update
+    cursor.execute("CREATE INDEX IF NOT EXISTS idx_vocab_progress_vocab ON vocabulary_progress(vocabulary_id)")
+    # Status filters (practice queues, review query's learning/struggling branch)
+    cursor.execute("CREATE INDEX IF NOT EXISTS idx_vocab_progress_status ON vocabulary_progress(status, last_review)")
 
     # Word forms (generated from base vocabulary + grammar knowledge)
     cursor.execute("""
@@ -167,6 +284,19 @@ def init_database():
         )
     """)
 
+    # Daily practice rollup - one row per (date, activity type) instead of a
+    # practice_sessions row per answer
+    cursor.execute("""
+        CREATE TABLE IF NOT EXISTS practice_daily (
+            date DATE NOT NULL,
+            activity_type TEXT NOT NULL,
+            items INTEGER DEFAULT 0,
+            total_accuracy REAL DEFAULT 0,
+            practice_seconds INTEGER DEFAULT 0,
+            PRIMARY KEY (date, activity_type)
+        )
+    """)
+
     # Pronunciation attempts table
     cursor.execute("""
         CREATE TABLE IF NOT EXISTS pronunciation_attempts (
@@ -182,6 +312,8 @@ def init_database():
             FOREIGN KEY (phrase_id) REFERENCES phrases(id)
         )
     """)
+    # Covers the 7-day accuracy average on the stats page
+    cursor.execute("CREATE INDEX IF NOT EXISTS idx_pronunciation_created ON pronunciation_attempts(created_at, accuracy)")
 
     # Conversation history table
     cursor.execute("""
@@ -331,6 +463,25 @@ def init_database():
         cursor.execute("ALTER TABLE user_progress ADD COLUMN total_practice_seconds INTEGER DEFAULT 0")
         conn.commit()
 
+    # Migration: Fold the old one-row-per-answer practice sessions into the daily rollup
+    cursor.execute("""
+        SELECT COUNT(*) FROM practice_sessions
+        WHERE session_type = 'practice' AND items_practiced = 1
+    """)
+    if cursor.fetchone()[0] > 0:
+        cursor.execute("""
+            INSERT INTO practice_daily (date, activity_type, items, total_accuracy)
+            SELECT date(COALESCE(ended_at, started_at)), 'practice', COUNT(*), COALESCE(SUM(average_accuracy), 0)
+            FROM practice_sessions
+            WHERE session_type = 'practice' AND items_practiced = 1
+            GROUP BY date(COALESCE(ended_at, started_at))
+            ON CONFLICT(date, activity_type) DO UPDATE SET
+                items = items + excluded.items,
+                total_accuracy = total_accuracy + excluded.total_accuracy
+        """)
+        cursor.execute("DELETE FROM practice_sessions WHERE session_type = 'practice' AND items_practiced = 1")
+        conn.commit()
+
     # Migration: Recreate word_forms table with correct schema if old schema exists
     try:
         cursor.execute("SELECT base_word_id FROM word_forms LIMIT 1")
@@ -440,6 +591,56 @@ def get_units(section_id: int = None) -> list:
     return results
 
 
+def get_learning_path() -> list:
+    """
+    Get all sections with their units (and word/phrase counts) in one query.
+
+    Returns:
+        List of section dicts in order, each with a 'units' list of unit dicts
+    """
+    conn = get_connection()
+    cursor = conn.cursor()
+    # Count words/phrases per unit once (GROUP BY) rather than per unit row
+    cursor.execute("""
+        SELECT s.id AS section_id, s.name AS section_name, s.description AS section_description,
+            s.cefr_level, s.is_unlocked AS section_unlocked,
+            u.id AS unit_id, u.name AS unit_name, u.is_unlocked, u.is_completed,
+            COALESCE(vc.word_count, 0) AS word_count,
+            COALESCE(pc.phrase_count, 0) AS phrase_count
+        FROM sections s
+        LEFT JOIN units u ON u.section_id = s.id
+        LEFT JOIN (SELECT unit_id, COUNT(*) AS word_count FROM vocabulary GROUP BY unit_id) vc
+            ON vc.unit_id = u.id
+        LEFT JOIN (SELECT unit_id, COUNT(*) AS phrase_count FROM phrases GROUP BY unit_id) pc
+            ON pc.unit_id = u.id
+        ORDER BY s.order_num, u.order_num
+    """)
+    rows = cursor.fetchall()
+    conn.close()
+
+    sections = []
+    for row in rows:
+        if not sections or sections[-1]['id'] != row['section_id']:
+            sections.append({
+                'id': row['section_id'],
+                'name': row['section_name'],
+                'description': row['section_description'],
+                'cefr_level': row['cefr_level'],
+                'is_unlocked': row['section_unlocked'],
+                'units': [],
+            })
+        if row['unit_id'] is not None:
+            sections[-1]['units'].append({
+                'id': row['unit_id'],
+                'name': row['unit_name'],
+                'is_unlocked': row['is_unlocked'],
+                'is_completed': row['is_completed'],
+                'word_count': row['word_count'],
+                'phrase_count': row['phrase_count'],
+            })
+    return sections
+
+
 def unlock_unit(unit_id: int):
     """Unlock a unit"""
     conn = get_connection()
@@ -611,7 +812,13 @@ def get_vocabulary_for_review(limit: int = 10, unit_id: int = None) -> list:
     """
     conn = get_connection()
     cursor = conn.cursor()
+    results = _select_vocabulary_for_review(cursor, limit, unit_id)
+    conn.close()
+    return results
+
 
+def _select_vocabulary_for_review(cursor, limit: int, unit_id: int = None) -> list:
+    """Run the review-queue query on an existing cursor"""
     today_start = datetime.now().replace(hour=0, minute=0, second=0, microsecond=0).isoformat()
 
     query = """
@@ -639,9 +846,7 @@ def get_vocabulary_for_review(limit: int = 10, unit_id: int = None) -> list:
     params.append(limit)
 
     cursor.execute(query, params)
-    results = [dict(row) for row in cursor.fetchall()]
-    conn.close()
-    return results
+    return [dict(row) for row in cursor.fetchall()]
 
 
 def get_vocabulary_by_id(vocab_id: int) -> dict:
@@ -703,6 +908,47 @@ def get_vocabulary_by_status(status: str, limit: int = 20, offset: int = 0, excl
     return results
 
 
+def get_vocabulary_by_status_with_count(status: str, limit: int = 20, offset: int = 0) -> tuple:
+    """
+    Get a page of vocabulary items by status together with the status total.
+
+    Same ordering as get_vocabulary_by_status; the total comes from a window
+    function in the same query, so paging needs one round trip instead of two.
+    An offset at or past the end wraps back to the first page in that same
+    query, so callers cycling through a status never need a second fetch.
+
+    Returns:
+        tuple: (words, total)
+    """
+    conn = get_connection()
+    cursor = conn.cursor()
+    cursor.execute("""
+        WITH ranked AS (
+            SELECT v.*, vp.ease_factor, vp.interval_days, vp.repetitions,
+                   vp.times_correct, vp.times_incorrect, vp.status,
+                   u.name as unit_name,
+                   ROW_NUMBER() OVER (ORDER BY vp.times_incorrect DESC, vp.last_review ASC) - 1 AS status_row,
+                   COUNT(*) OVER () AS status_total
+            FROM vocabulary v
+            JOIN vocabulary_progress vp ON v.id = vp.vocabulary_id
+            LEFT JOIN units u ON v.unit_id = u.id
+            WHERE vp.status = ?
+        )
+        SELECT * FROM ranked
+        WHERE status_row >= CASE WHEN ? < status_total THEN ? ELSE 0 END
+        ORDER BY status_row
+        LIMIT ?
+    """, (status, offset, offset, limit))
+    words = [dict(row) for row in cursor.fetchall()]
+    conn.close()
+
+    total = words[0]['status_total'] if words else 0
+    for word in words:
+        del word['status_row']
+        del word['status_total']
+    return words, total
+
+
 def count_vocabulary_by_status(status: str, exclude_practiced_today: bool = False) -> int:
     """Count vocabulary items by status, optionally excluding those practiced today."""
     conn = get_connection()
@@ -740,62 +986,44 @@ def get_vocabulary_pipeline_stats() -> dict:
 
     today_start = datetime.now().replace(hour=0, minute=0, second=0, microsecond=0).isoformat()
 
-    stats = {}
-
-    # New words (never practiced)
-    cursor.execute("SELECT COUNT(*) FROM vocabulary_progress WHERE status = 'new'")
-    stats['new'] = cursor.fetchone()[0]
-
-    # Struggling words
-    cursor.execute("SELECT COUNT(*) FROM vocabulary_progress WHERE status = 'struggling'")
-    stats['struggling'] = cursor.fetchone()[0]
-
-    # Learned/mastered words
-    cursor.execute("SELECT COUNT(*) FROM vocabulary_progress WHERE status = 'learned'")
-    stats['learned'] = cursor.fetchone()[0]
-
-    # Learning words broken down by repetitions (successful recalls)
+    # Every count in one pass over vocabulary_progress
     cursor.execute("""
         SELECT
-            CASE
-                WHEN repetitions = 1 THEN '1'
-                WHEN repetitions = 2 THEN '2'
-                WHEN repetitions = 3 THEN '3'
-                ELSE '4+'
-            END as rep_group,
-            COUNT(*) as count
+            COUNT(*) FILTER (WHERE status = 'new') AS new,
+            COUNT(*) FILTER (WHERE status = 'struggling') AS struggling,
+            COUNT(*) FILTER (WHERE status = 'learned') AS learned,
+            -- Learning words broken down by repetitions (successful recalls)
+            COUNT(*) FILTER (WHERE status = 'learning' AND repetitions = 1) AS learning_1,
+            COUNT(*) FILTER (WHERE status = 'learning' AND repetitions = 2) AS learning_2,
+            COUNT(*) FILTER (WHERE status = 'learning' AND repetitions = 3) AS learning_3,
+            COUNT(*) FILTER (WHERE status = 'learning') AS learning,
+            -- Words practiced today, and learning/struggling words not yet practiced today
+            COUNT(*) FILTER (WHERE last_review >= ?) AS practiced_today,
+            COUNT(*) FILTER (WHERE status IN ('learning', 'struggling')
+                             AND (last_review IS NULL OR last_review < ?)) AS remaining_today,
+            (SELECT COUNT(*) FROM vocabulary) AS total
         FROM vocabulary_progress
-        WHERE status = 'learning'
-        GROUP BY rep_group
-        ORDER BY rep_group
-    """)
-    learning_by_reps = {'1': 0, '2': 0, '3': 0, '4+': 0}
-    for row in cursor.fetchall():
-        learning_by_reps[row['rep_group']] = row['count']
-    stats['learning_by_reps'] = learning_by_reps
-    stats['learning_total'] = sum(learning_by_reps.values())
-
-    # Words practiced today
-    cursor.execute("""
-        SELECT COUNT(*) FROM vocabulary_progress
-        WHERE last_review >= ?
-    """, (today_start,))
-    stats['practiced_today'] = cursor.fetchone()[0]
-
-    # Learning/struggling words NOT yet practiced today
-    cursor.execute("""
-        SELECT COUNT(*) FROM vocabulary_progress
-        WHERE status IN ('learning', 'struggling')
-        AND (last_review IS NULL OR last_review < ?)
-    """, (today_start,))
-    stats['remaining_today'] = cursor.fetchone()[0]
+    """, (today_start, today_start))
+    counts = cursor.fetchone()
+    conn.close()
 
-    # Total words
-    cursor.execute("SELECT COUNT(*) FROM vocabulary")
-    stats['total'] = cursor.fetchone()[0]
+    learning_by_reps = {
+        '1': counts['learning_1'],
+        '2': counts['learning_2'],
+        '3': counts['learning_3'],
+    }
+    learning_by_reps['4+'] = counts['learning'] - sum(learning_by_reps.values())
 
-    conn.close()
-    return stats
+    return {
+        'new': counts['new'],
+        'struggling': counts['struggling'],
+        'learned': counts['learned'],
+        'learning_by_reps': learning_by_reps,
+        'learning_total': counts['learning'],
+        'practiced_today': counts['practiced_today'],
+        'remaining_today': counts['remaining_today'],
+        'total': counts['total'],
+    }
 
 
 def get_vocabulary_stats() -> dict:
@@ -851,14 +1079,63 @@ def update_vocabulary_progress(vocabulary_id: int, quality: int):
     conn = get_connection()
     cursor = conn.cursor()
 
+    result = _apply_vocabulary_review(cursor, vocabulary_id, quality)
+    if result is None:
+        conn.close()
+        return
+
+    status, xp_earned = result
+    conn.commit()
+    conn.close()
+
+    if xp_earned > 0:
+        add_xp(xp_earned, 'vocabulary_review', f'Reviewed vocabulary')
+
+    return status
+
+
+def update_and_next(vocabulary_id: int, quality: int, limit: int = 1) -> list:
+    """
+    Record a vocabulary review and fetch the next review items in one
+    transaction (one connection instead of an update plus a separate query).
+
+    Args:
+        vocabulary_id: ID of the vocabulary item just reviewed
+        quality: Quality of recall (0-5), see update_vocabulary_progress
+        limit: Number of next items to return
+
+    Returns:
+        List of vocabulary items due for review (same shape as get_vocabulary_for_review)
+    """
+    conn = get_connection()
+    cursor = conn.cursor()
+
+    result = _apply_vocabulary_review(cursor, vocabulary_id, quality)
+    next_items = _select_vocabulary_for_review(cursor, limit)
+
+    conn.commit()
+    conn.close()
+
+    if result and result[1] > 0:
+        add_xp(result[1], 'vocabulary_review', f'Reviewed vocabulary')
+
+    return next_items
+
+
+def _apply_vocabulary_review(cursor, vocabulary_id: int, quality: int):
+    """
+    Apply one SM-2 review step on an existing cursor (caller commits).
+
+    Returns:
+        (new_status, xp_earned), or None if the word has no progress row
+    """
     # Get current progress
     cursor.execute("""
         SELECT * FROM vocabulary_progress WHERE vocabulary_id = ?
     """, (vocabulary_id,))
     row = cursor.fetchone()
     if not row:
-        conn.close()
-        return
+        return None
 
     progress = dict(row)
     ease_factor = progress['ease_factor']
@@ -915,25 +1192,20 @@ def update_vocabulary_progress(vocabulary_id: int, quality: int):
     """, (ease_factor, interval, repetitions, times_correct, times_incorrect,
           status, next_review.isoformat(), datetime.now().isoformat(), vocabulary_id))
 
-    # Update user progress word counts
-    cursor.execute("""
-        UPDATE user_progress SET
-            words_learning = (SELECT COUNT(*) FROM vocabulary_progress WHERE status = 'learning'),
-            words_mastered = (SELECT COUNT(*) FROM vocabulary_progress WHERE status = 'learned')
-    """)
+    # Update user progress word counts (only a status change can move them)
+    if status != progress['status']:
+        cursor.execute("""
+            UPDATE user_progress SET
+                words_learning = (SELECT COUNT(*) FROM vocabulary_progress WHERE status = 'learning'),
+                words_mastered = (SELECT COUNT(*) FROM vocabulary_progress WHERE status = 'learned')
+        """)
 
     # Award XP based on quality
     xp_earned = 0
     if quality >= 3:
         xp_earned = 5 if quality == 3 else (10 if quality == 4 else 15)
 
-    conn.commit()
-    conn.close()
-
-    if xp_earned > 0:
-        add_xp(xp_earned, 'vocabulary_review', f'Reviewed vocabulary')
-
-    return status
+    return status, xp_earned
 
 
 def get_all_vocabulary(category: str = None, unit_id: int = None, cefr_level: str = None) -> list:
@@ -1122,12 +1394,55 @@ def add_practice_time(seconds: int):
     conn.close()
 
 
+def flush_practice_events(events: list):
+    """
+    Record buffered practice activities in a single transaction.
+
+    Args:
+        events: List of (practice_seconds, accuracy, occurred_at) tuples, one per
+            activity, as collected by the app's smart session tracking
+    """
+    if not events:
+        return
+
+    # Roll the events up per day: (items, total_accuracy, practice_seconds)
+    daily = {}
+    for seconds, accuracy, occurred_at in events:
+        date = occurred_at.date().isoformat()
+        items, total_accuracy, total_seconds = daily.get(date, (0, 0.0, 0))
+        daily[date] = (items + 1, total_accuracy + accuracy, total_seconds + seconds)
+
+    conn = get_connection()
+    cursor = conn.cursor()
+
+    cursor.executemany("""
+        INSERT INTO practice_daily (date, activity_type, items, total_accuracy, practice_seconds)
+        VALUES (?, 'practice', ?, ?, ?)
+        ON CONFLICT(date, activity_type) DO UPDATE SET
+            items = items + excluded.items,
+            total_accuracy = total_accuracy + excluded.total_accuracy,
+            practice_seconds = practice_seconds + excluded.practice_seconds
+    """, [(date, *totals) for date, totals in daily.items()])
+
+    total_seconds = sum(seconds for seconds, _, _ in events)
+    if total_seconds > 0:
+        cursor.execute("""
+            UPDATE user_progress
+            SET total_practice_seconds = COALESCE(total_practice_seconds, 0) + ?
+            WHERE id = 1
+        """, (total_seconds,))
+
+    conn.commit()
+    conn.close()
+
+
 def reset_practice_time():
     """Reset practice time to 0"""
     conn = get_connection()
     cursor = conn.cursor()
     cursor.execute("UPDATE user_progress SET total_practice_seconds = 0 WHERE id = 1")
     cursor.execute("DELETE FROM practice_sessions")
+    cursor.execute("DELETE FROM practice_daily")
     conn.commit()
     conn.close()
 
@@ -1207,8 +1522,11 @@ def get_statistics() -> dict:
     cursor.execute("SELECT COUNT(*) FROM vocabulary_progress WHERE status = 'new'")
     stats['new_words_available'] = cursor.fetchone()[0]
 
-    # Total practice sessions
-    cursor.execute("SELECT COUNT(*) FROM practice_sessions")
+    # Total practice sessions (explicit sessions plus rolled-up practice activities)
+    cursor.execute("""
+        SELECT (SELECT COUNT(*) FROM practice_sessions)
+             + (SELECT COALESCE(SUM(items), 0) FROM practice_daily)
+    """)
     stats['total_sessions'] = cursor.fetchone()[0]
 
     # Total practice time (from smart session tracking)
@@ -1270,6 +1588,7 @@ def get_daily_goal_progress() -> dict:
         WHERE DATE(created_at) = ?
     """, (today,))
     pronunciations_today = cursor.fetchone()[0]
+    conn.close()
 
     return {
         'xp_today': xp_today,
@@ -1281,14 +1600,97 @@ def get_daily_goal_progress() -> dict:
     }
 
 
+def get_home_snapshot() -> dict:
+    """
+    Get everything the Home tab displays in one round trip.
+
+    Returns dict with:
+    - progress: The user_progress row (as get_user_progress)
+    - vocabulary: Counts by status plus due/total (as get_vocabulary_stats)
+    - pipeline: Rehearsal pipeline counts (as get_vocabulary_pipeline_stats)
+    - daily: Daily goal progress (as get_daily_goal_progress)
+    """
+    conn = get_connection()
+    cursor = conn.cursor()
+
+    now = datetime.now()
+    today = now.date().isoformat()
+    today_start = now.replace(hour=0, minute=0, second=0, microsecond=0).isoformat()
+
+    cursor.execute("""
+        SELECT
+            COUNT(*) FILTER (WHERE status = 'new') AS new,
+            COUNT(*) FILTER (WHERE status = 'struggling') AS struggling,
+            COUNT(*) FILTER (WHERE status = 'learned') AS learned,
+            COUNT(*) FILTER (WHERE status = 'learning') AS learning,
+            COUNT(*) FILTER (WHERE status = 'learning' AND repetitions = 1) AS learning_1,
+            COUNT(*) FILTER (WHERE status = 'learning' AND repetitions = 2) AS learning_2,
+            COUNT(*) FILTER (WHERE status = 'learning' AND repetitions = 3) AS learning_3,
+            COUNT(*) FILTER (WHERE next_review <= ? AND status != 'new') AS due,
+            COUNT(*) FILTER (WHERE last_review >= ?) AS practiced_today,
+            COUNT(*) FILTER (WHERE status IN ('learning', 'struggling')
+                             AND (last_review IS NULL OR last_review < ?)) AS remaining_today,
+            COUNT(*) FILTER (WHERE DATE(last_review) = ?) AS words_reviewed,
+            (SELECT COUNT(*) FROM vocabulary) AS total,
+            (SELECT SUM(xp_amount) FROM xp_log WHERE DATE(created_at) = ?) AS xp_today,
+            (SELECT COUNT(*) FROM pronunciation_attempts WHERE DATE(created_at) = ?) AS pronunciations
+        FROM vocabulary_progress
+    """, (now.isoformat(), today_start, today_start, today, today, today))
+    counts = cursor.fetchone()
+
+    cursor.execute("SELECT * FROM user_progress LIMIT 1")
+    progress = cursor.fetchone()
+    conn.close()
+
+    learning_by_reps = {
+        '1': counts['learning_1'],
+        '2': counts['learning_2'],
+        '3': counts['learning_3'],
+    }
+    learning_by_reps['4+'] = counts['learning'] - sum(learning_by_reps.values())
+
+    return {
+        'progress': dict(progress) if progress else {},
+        'vocabulary': {
+            'new': counts['new'],
+            'learning': counts['learning'],
+            'learned': counts['learned'],
+            'struggling': counts['struggling'],
+            'due': counts['due'],
+            'new_available': counts['new'],
+            'total': counts['total'],
+        },
+        'pipeline': {
+            'new': counts['new'],
+            'struggling': counts['struggling'],
+            'learned': counts['learned'],
+            'learning_by_reps': learning_by_reps,
+            'learning_total': counts['learning'],
+            'practiced_today': counts['practiced_today'],
+            'remaining_today': counts['remaining_today'],
+            'total': counts['total'],
+        },
+        'daily': {
+            'xp_today': counts['xp_today'] or 0,
+            'xp_goal': 50,  # Daily XP goal
+            'words_reviewed': counts['words_reviewed'],
+            'words_goal': 10,
+            'pronunciations': counts['pronunciations'],
+            'pronunciation_goal': 5
+        },
+    }
+
+
 # ============ AI Coach Functions ============
 
-def get_recommended_activities() -> list:
-    """Get AI-recommended activities for today"""
+def get_recommended_activities(stats: dict = None, daily: dict = None) -> list:
+    """Get AI-recommended activities for today (pass stats/daily to reuse a home snapshot)"""
     recommendations = []
 
-    stats = get_vocabulary_stats()
-    daily = get_daily_goal_progress()
+    if stats is None:
+        stats = get_vocabulary_stats()
+    if daily is None:
+        daily = get_daily_goal_progress()
 
     # Priority 1: Words due for review
     if stats.get('due', 0) > 0:
@@ -1462,6 +1864,11 @@ def get_package_vocabulary(package_id: int) -> list:
     return results
 
 
+# Interjection-like noise ("aaah", "oooh") rejected by is_valid_vocabulary_word
+LEADING_REPEAT_PATTERN = re.compile(r'^(.)\1{2,}')
+REPEATED_RUN_PATTERN = re.compile(r'(.)\1{3,}')
+
+
 def is_valid_vocabulary_word(spanish: str, english: str) -> tuple:
     """
     Check if a word passes quality checks for adding to vocabulary.
@@ -1469,8 +1876,6 @@ def is_valid_vocabulary_word(spanish: str, english: str) -> tuple:
     Returns:
         (is_valid: bool, reason: str)
     """
-    import re
-
     # Must have Spanish word
     if not spanish or not spanish.strip():
         return False, "empty Spanish word"
@@ -1482,11 +1887,11 @@ def is_valid_vocabulary_word(spanish: str, english: str) -> tuple:
         return False, "missing English translation"
 
     # Check for repeated characters (like "aaah", "oooh")
-    if re.match(r'^(.)\1{2,}', spanish):
+    if LEADING_REPEAT_PATTERN.match(spanish):
         return False, "repeated characters"
 
     # Check if word contains repeated character sequences
-    if re.search(r'(.)\1{3,}', spanish):
+    if REPEATED_RUN_PATTERN.search(spanish):
         return False, "excessive repeated characters"
 
     # Too short (less than 2 characters)
@@ -16,7 +16,8 @@ def get_nlp():
     """Lazy load SpaCy Spanish model"""
     global _nlp
     if _nlp is None:
-        _nlp = spacy.load("es_core_news_sm")
+        # Only POS, morphology, dependencies and lemmas are used - skip entity recognition
+        _nlp = spacy.load("es_core_news_sm", disable=["ner"])
     return _nlp
 
 
@@ -30,9 +31,11 @@ def detect_verb_tenses(text: str) -> Dict[str, int]:
     Returns:
         Dict with tense names and their occurrence counts
     """
-    nlp = get_nlp()
-    doc = nlp(text)
+    return _count_verb_tenses(get_nlp()(text))
 
+
+def _count_verb_tenses(doc) -> Dict[str, int]:
+    """Count verb tenses in an already parsed document"""
     tense_counts = Counter()
 
     for token in doc:
@@ -79,9 +82,11 @@ def detect_grammar_structures(text: str) -> Dict[str, int]:
     Returns:
         Dict with structure names and occurrence counts
     """
-    nlp = get_nlp()
-    doc = nlp(text)
+    return _count_grammar_structures(get_nlp()(text))
+
 
+def _count_grammar_structures(doc) -> Dict[str, int]:
+    """Count grammar structures in an already parsed document"""
     structures = Counter()
 
     for token in doc:
@@ -110,12 +115,12 @@ def analyze_grammar_patterns(text: str) -> Dict:
     Returns:
         Dict with complete grammar analysis
     """
-    tenses = detect_verb_tenses(text)
-    structures = detect_grammar_structures(text)
+    # Parse once and run every detector on the same document
+    doc = get_nlp()(text)
+    tenses = _count_verb_tenses(doc)
+    structures = _count_grammar_structures(doc)
 
     # Count total verbs
-    nlp = get_nlp()
-    doc = nlp(text)
     total_verbs = sum(1 for token in doc if token.pos_ in ['VERB', 'AUX'])
 
     return {
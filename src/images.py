@@ -77,7 +77,39 @@ def is_imageable(category: str) -> bool:
     return False
 
 
+# Found images by (query, fallback_query) - repeat "Help me remember" clicks
+# skip the API call and don't spend the 50 requests/hour free-tier quota
+_image_cache = {}
+
+
+def _display_url(photo: dict) -> str:
+    """400px-wide image URL, served as WebP by Unsplash's image CDN"""
+    # The "raw" URL takes imgix sizing/format parameters (the "small" preset is a JPEG)
+    return photo["urls"]["raw"] + "&w=400&q=80&fit=max&fm=webp"
+
+
 def search_image(query: str, fallback_query: str = None) -> Tuple[Optional[str], Optional[str]]:
+    """
+    Search for an image on Unsplash (found images are cached in memory).
+
+    Args:
+        query: The search term (usually the English translation)
+        fallback_query: Alternative search term if first fails
+
+    Returns:
+        Tuple of (image_url, photographer_credit) or (None, None) if not found
+    """
+    key = (query, fallback_query)
+    if key in _image_cache:
+        return _image_cache[key]
+
+    image_url, credit = _search_unsplash(query, fallback_query)
+    if image_url:
+        _image_cache[key] = (image_url, credit)
+    return image_url, credit
+
+
+def _search_unsplash(query: str, fallback_query: str = None) -> Tuple[Optional[str], Optional[str]]:
     """
     Search for an image on Unsplash.
 
@@ -109,7 +141,7 @@ def search_image(query: str, fallback_query: str = None) -> Tuple[Optional[str],
 
             if data.get("results") and len(data["results"]) > 0:
                 photo = data["results"][0]
-                image_url = photo["urls"]["small"]  # 400px wide
+                image_url = _display_url(photo)
                 photographer = photo["user"]["name"]
                 return image_url, f"Photo by {photographer} on Unsplash"
 
@@ -123,7 +155,7 @@ def search_image(query: str, fallback_query: str = None) -> Tuple[Optional[str],
 
                 if data.get("results") and len(data["results"]) > 0:
                     photo = data["results"][0]
-                    image_url = photo["urls"]["small"]
+                    image_url = _display_url(photo)
                     photographer = photo["user"]["name"]
                     return image_url, f"Photo by {photographer} on Unsplash"
 
@@ -7,8 +7,17 @@ Multi-tier model strategy:
 - ACCURATE_MODEL: For linguistic analysis, grammar, definitions (accuracy priority)
 - TRANSLATE_MODEL: For Spanish↔English translation (translation-optimized)
 - MEMORY_MODEL: For memorable sentence generation (creative + word inclusion)
+- FEEDBACK_MODEL: For short feedback/explanations on button clicks (latency priority)
 """
 
+import functools
+import os
+import random
+import re
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
 import ollama
 from typing import Generator, Optional
 
@@ -33,6 +42,11 @@ TRANSLATE_MODEL = "translategemma:4b"
 # and produces clean output without unwanted explanations
 MEMORY_MODEL = "gemma2:2b"
 
+# Small quantized model for short, click-driven completions:
+# pronunciation feedback, grammar explanations, vocabulary help.
+# Pass model=ACCURATE_MODEL to those functions for the slower, deeper answer.
+FEEDBACK_MODEL = "qwen2.5:1.5b-instruct-q4_K_M"
+
 # Legacy default (for backwards compatibility)
 DEFAULT_MODEL = FAST_MODEL
 
@@ -259,6 +273,31 @@ def _get_model_for_mode(mode: str) -> str:
     return FAST_MODEL
 
 
+# The feedback model is an extra `ollama pull`; until it is installed, feedback
+# requests go to FAST_MODEL instead of failing with "model not found"
+_feedback_model_missing = False
+
+
+def _resolve_feedback_model(model: str) -> str:
+    """FAST_MODEL in place of FEEDBACK_MODEL once the latter is known to be missing"""
+    if model == FEEDBACK_MODEL and _feedback_model_missing:
+        return FAST_MODEL
+    return model
+
+
+def _fall_back_from_feedback_model(model: str, error: Exception) -> bool:
+    """Whether a failed request should be retried on FAST_MODEL (remembers the answer)"""
+    global _feedback_model_missing
+    if (model == FEEDBACK_MODEL and isinstance(error, ollama.ResponseError)
+            and error.status_code == 404):
+        if not _feedback_model_missing:
+            print(f"{FEEDBACK_MODEL} is not installed, using {FAST_MODEL} for feedback "
+                  f"(run: ollama pull {FEEDBACK_MODEL})")
+        _feedback_model_missing = True
+        return True
+    return False
+
+
 def _get_temperature_for_mode(mode: str) -> float:
     """Get the appropriate temperature for a given mode."""
     mode_to_temp = {
@@ -276,6 +315,36 @@ def _get_temperature_for_mode(mode: str) -> float:
     return mode_to_temp.get(mode, 0.7)
 
 
+# Low-temperature helpers give the same answer for the same input, so repeat
+# clicks (Translate, Explain, Look up, Suggest) are served from memory
+LLM_CACHE_SIZE = 1024
+
+
+def _cache_responses(func):
+    """LRU-cache a text helper's responses by its arguments, skipping errors"""
+    cache = OrderedDict()
+    lock = threading.Lock()
+
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        key = (args, tuple(sorted(kwargs.items())))
+        with lock:
+            if key in cache:
+                cache.move_to_end(key)
+                return cache[key]
+
+        response = func(*args, **kwargs)
+        if not response.startswith("Error:"):
+            with lock:
+                cache[key] = response
+                if len(cache) > LLM_CACHE_SIZE:
+                    cache.popitem(last=False)
+        return response
+
+    wrapper.cache_clear = cache.clear
+    return wrapper
+
+
 def chat(
     message: str,
     mode: str = "conversation",
@@ -297,6 +366,7 @@ def chat(
     # Auto-select model based on mode if not specified
     if model is None:
         model = _get_model_for_mode(mode)
+    model = _resolve_feedback_model(model)
 
     system_prompt = SYSTEM_PROMPTS.get(mode, SYSTEM_PROMPTS["conversation_female"])
     temperature = _get_temperature_for_mode(mode)
@@ -318,9 +388,31 @@ def chat(
         )
         return response['message']['content']
     except Exception as e:
+        if _fall_back_from_feedback_model(model, e):
+            return chat(message, mode, history, FAST_MODEL)
         return f"Error: {e}. Make sure Ollama is running and the model '{model}' is installed."
 
 
+def warm_up_models(models: list = None):
+    """
+    Load models into Ollama's memory ahead of the first request (an empty
+    prompt loads a model without generating anything).
+
+    Args:
+        models: Models to load (defaults to the conversation and feedback models)
+    """
+    for model in models or [FAST_MODEL, FEEDBACK_MODEL]:
+        try:
+            ollama.generate(model=model, prompt="")
+        except Exception as e:
+            if _fall_back_from_feedback_model(model, e):
+                continue  # Feedback will use FAST_MODEL, which is already loaded
+            # Ollama may not be running yet - the first real request will load it
+            print(f"LLM warm-up skipped for {model}: {e}")
+            return
+
+
+@_cache_responses
 def translate_to_english(spanish_text: str, model: str = None) -> str:
     """Translate Spanish text to English (uses ACCURATE_MODEL by default)"""
     return chat(spanish_text, mode="translate", model=model)
@@ -335,10 +427,54 @@ def suggest_response(history: list, model: str = None) -> str:
         for m in recent
     ])
 
+    return _suggest_for_context(context, model=model)
+
+
+@_cache_responses
+def _suggest_for_context(context: str, model: str = None) -> str:
+    """Suggestion for a rendered conversation excerpt (cached until the conversation moves on)"""
     prompt = f"Conversation so far:\n{context}\n\nSuggest what the learner could say next:"
     return chat(prompt, mode="suggest_response", model=model)
 
 
+# First-turn replies to the usual openers ("hola", "¿qué tal?") by mode and message.
+# Once a few variants are collected, a repeat opener gets one of them instantly
+# (its audio is then already in the TTS cache too); later turns depend on the
+# conversation and always go to the model.
+OPENER_CACHE_SIZE = 256
+OPENER_VARIANTS = 3
+
+_opener_replies = OrderedDict()  # (mode, model, normalized message) -> list of replies
+_opener_lock = threading.Lock()
+_OPENER_STRIP_PATTERN = re.compile(r'[¿¡?!.,;:]+')
+
+
+def _opener_key(message: str, mode: str, model: str) -> tuple:
+    """Cache key for a first-turn message (case, punctuation and spacing ignored)"""
+    return mode, model, " ".join(_OPENER_STRIP_PATTERN.sub(" ", message.lower()).split())
+
+
+def _cached_opener_reply(key: tuple) -> Optional[str]:
+    """A stored reply for this opener, once enough variants are collected"""
+    with _opener_lock:
+        replies = _opener_replies.get(key)
+        if replies is None or len(replies) < OPENER_VARIANTS:
+            return None
+        _opener_replies.move_to_end(key)
+        return random.choice(replies)
+
+
+def _store_opener_reply(key: tuple, reply: str):
+    """Remember a model reply to an opener"""
+    with _opener_lock:
+        replies = _opener_replies.setdefault(key, [])
+        _opener_replies.move_to_end(key)
+        if len(replies) < OPENER_VARIANTS and reply not in replies:
+            replies.append(reply)
+        if len(_opener_replies) > OPENER_CACHE_SIZE:
+            _opener_replies.popitem(last=False)
+
+
 def chat_stream(
     message: str,
     mode: str = "conversation",
@@ -360,6 +496,7 @@ def chat_stream(
     # Auto-select model based on mode if not specified
     if model is None:
         model = _get_model_for_mode(mode)
+    model = _resolve_feedback_model(model)
 
     system_prompt = SYSTEM_PROMPTS.get(mode, SYSTEM_PROMPTS["conversation_female"])
     temperature = _get_temperature_for_mode(mode)
@@ -371,6 +508,15 @@ def chat_stream(
 
     messages.append({"role": "user", "content": message})
 
+    is_opener = not history and mode.startswith("conversation")
+    opener_key = _opener_key(message, mode, model) if is_opener else None
+    if opener_key:
+        reply = _cached_opener_reply(opener_key)
+        if reply:
+            yield reply
+            return
+
+    reply = ""
     try:
         stream = ollama.chat(
             model=model,
@@ -381,39 +527,61 @@ def chat_stream(
             }
         )
         for chunk in stream:
+            reply += chunk['message']['content']
             yield chunk['message']['content']
+        if opener_key and reply.strip():
+            _store_opener_reply(opener_key, reply)
     except Exception as e:
+        # The request is sent on first iteration, so a missing model fails
+        # before anything has been yielded
+        if not reply and _fall_back_from_feedback_model(model, e):
+            yield from chat_stream(message, mode, history, FAST_MODEL)
+            return
         yield f"Error: {e}"
 
 
-def get_pronunciation_feedback(expected: str, spoken: str, accuracy: float) -> str:
+def get_pronunciation_feedback(expected: str, spoken: str, accuracy: float, model: str = None) -> str:
     """
-    Get detailed pronunciation feedback from LLM
+    Get detailed pronunciation feedback from LLM (uses FEEDBACK_MODEL by default)
 
     Args:
         expected: The phrase that should have been said
         spoken: What Whisper transcribed
         accuracy: Accuracy percentage from comparison
+        model: Ollama model to use (defaults to FEEDBACK_MODEL if None)
 
     Returns:
         Feedback message
     """
-    prompt = f"""The learner tried to say: "{expected}"
+    prompt = _pronunciation_feedback_prompt(expected, spoken, accuracy)
+    return chat(prompt, mode="pronunciation_feedback", model=model or FEEDBACK_MODEL)
+
+
+def get_pronunciation_feedback_stream(expected: str, spoken: str, accuracy: float,
+                                      model: str = None) -> Generator[str, None, None]:
+    """Stream pronunciation feedback chunks as they arrive (see get_pronunciation_feedback)"""
+    prompt = _pronunciation_feedback_prompt(expected, spoken, accuracy)
+    yield from chat_stream(prompt, mode="pronunciation_feedback", model=model or FEEDBACK_MODEL)
+
+
+def _pronunciation_feedback_prompt(expected: str, spoken: str, accuracy: float) -> str:
+    """Build the pronunciation feedback request"""
+    return f"""The learner tried to say: "{expected}"
 What they actually said (according to speech recognition): "{spoken}"
 Accuracy score: {accuracy}%
 
 Please provide helpful pronunciation feedback."""
 
-    return chat(prompt, mode="pronunciation_feedback")
-
 
-def explain_grammar(text: str, question: str = None) -> str:
+@_cache_responses
+def explain_grammar(text: str, question: str = None, model: str = None) -> str:
     """
-    Explain grammar in a Spanish text
+    Explain grammar in a Spanish text (uses FEEDBACK_MODEL by default)
 
     Args:
         text: Spanish text to analyze
         question: Optional specific question about the grammar
+        model: Ollama model to use (defaults to FEEDBACK_MODEL if None)
 
     Returns:
         Grammar explanation
@@ -423,21 +591,23 @@ def explain_grammar(text: str, question: str = None) -> str:
     else:
         prompt = f'Please explain the grammar in this Spanish phrase: "{text}"'
 
-    return chat(prompt, mode="grammar_explanation")
+    return chat(prompt, mode="grammar_explanation", model=model or FEEDBACK_MODEL)
 
 
-def get_vocabulary_help(word_or_phrase: str) -> str:
+@_cache_responses
+def get_vocabulary_help(word_or_phrase: str, model: str = None) -> str:
     """
-    Get help with Spanish vocabulary
+    Get help with Spanish vocabulary (uses FEEDBACK_MODEL by default)
 
     Args:
         word_or_phrase: Spanish word or phrase to explain
+        model: Ollama model to use (defaults to FEEDBACK_MODEL if None)
 
     Returns:
         Vocabulary explanation
     """
     prompt = f'Please explain this Spanish word/phrase: "{word_or_phrase}"'
-    return chat(prompt, mode="vocabulary_helper")
+    return chat(prompt, mode="vocabulary_helper", model=model or FEEDBACK_MODEL)
 
 
 def generate_practice_sentence(topic: str, difficulty: str = "beginner") -> str:
@@ -483,6 +653,101 @@ def generate_memory_sentence(spanish: str, english: str, model: str = None) -> s
     return chat(prompt, mode="memory_sentence", model=model)
 
 
+def _fallback_word_analysis(word: str) -> dict:
+    """Frequency-data entry for a word the LLM could not analyze"""
+    from src.frequency_data import get_translation
+    from src.content_analysis import lemmatize_spanish
+
+    base = word.lower().strip()
+    translation = get_translation(base)
+    base_form = base
+
+    # If no translation in frequency data, try lemmatization
+    if not translation:
+        lemma = lemmatize_spanish(base)
+        if lemma != base:
+            base_form = lemma
+            translation = get_translation(lemma)
+
+    return {
+        'spanish': word,
+        'base_form': base_form,
+        'english': translation,
+        'pos': 'unknown',
+        'skip': False
+    }
+
+
+def _analyze_word_batch(batch: list, model: str = None) -> list:
+    """Analyze one batch of words with a single LLM call, falling back per word"""
+    import json
+    import unicodedata
+
+    words_str = ", ".join(batch)
+    prompt = f"Analyze these Spanish words: {words_str}"
+
+    try:
+        response = chat(prompt, mode="word_analysis", model=model)
+
+        # Try to parse JSON from response
+        # Handle case where LLM might include extra text
+        json_start = response.find('{')
+        json_end = response.rfind('}') + 1
+
+        if json_start >= 0 and json_end > json_start:
+            json_str = response[json_start:json_end]
+
+            # Handle potential encoding issues by ensuring proper UTF-8
+            # This fixes issues where accented characters may be corrupted
+            try:
+                # Normalize unicode characters to ensure consistency
+                json_str = unicodedata.normalize('NFC', json_str)
+                data = json.loads(json_str)
+                return data.get('words', [])
+            except (json.JSONDecodeError, UnicodeDecodeError) as parse_error:
+                # If JSON parsing fails, try to extract word data using simpler fallback
+                # This handles cases where encoding corruption makes JSON invalid
+                print(f"Warning: JSON parse error, attempting fallback translation lookup")
+                print(f"  Error: {parse_error}")
+                return [_fallback_word_analysis(word) for word in batch]
+
+        print(f"Warning: Could not find JSON in LLM response for batch")
+        print(f"  Response preview: {response[:200]}...")
+        print(f"  Retrying words individually, with frequency_data as the last resort")
+        results = []
+        for word in batch:
+            try:
+                # Retry this single word
+                single_response = chat(f"Analyze this Spanish word: {word}", mode="word_analysis", model=model)
+                single_json_start = single_response.find('{')
+                single_json_end = single_response.rfind('}') + 1
+
+                if single_json_start >= 0 and single_json_end > single_json_start:
+                    single_json_str = single_response[single_json_start:single_json_end]
+                    single_json_str = unicodedata.normalize('NFC', single_json_str)
+                    single_data = json.loads(single_json_str)
+                    word_results = single_data.get('words', [])
+                    if word_results:
+                        results.extend(word_results)
+                        continue
+            except Exception as retry_error:
+                print(f"  Individual retry failed for '{word}': {retry_error}")
+
+            # If individual retry also failed, use frequency_data fallback
+            results.append(_fallback_word_analysis(word))
+        return results
+
+    except Exception as e:
+        print(f"Error in word analysis: {e}")
+        # Fallback to frequency_data with lemmatization
+        return [_fallback_word_analysis(word) for word in batch]
+
+
+# Word-analysis batches sent to Ollama at once; matches the number of
+# requests the server runs in parallel (see LLM_EVENT in app.py)
+WORD_ANALYSIS_WORKERS = int(os.environ.get("OLLAMA_NUM_PARALLEL", 2))
+
+
 def analyze_words_with_llm(words: list, model: str = None, progress_callback=None) -> list:
     """
     Analyze a list of Spanish words using Ollama to get:
@@ -492,173 +757,35 @@ def analyze_words_with_llm(words: list, model: str = None, progress_callback=Non
     - Whether to skip (names, stop words)
 
     Uses ACCURATE_MODEL by default for linguistic precision.
+    Batches are analyzed concurrently (WORD_ANALYSIS_WORKERS at a time);
+    results keep the order of the input words.
 
     Args:
         words: List of Spanish words to analyze
         model: Ollama model to use (defaults to ACCURATE_MODEL)
-        progress_callback: Optional callback(current, total, message) for progress updates
+        progress_callback: Optional callback(current, total, message), called
+            as each batch finishes
 
     Returns:
         List of dicts with analyzed word info
     """
-    import json
-    import unicodedata
-
     if not words:
         return []
 
     # Process in batches of 20 to avoid overwhelming the LLM
     batch_size = 20
-    all_results = []
-    total_batches = (len(words) + batch_size - 1) // batch_size
+    batches = [words[i:i + batch_size] for i in range(0, len(words), batch_size)]
+    total_batches = len(batches)
 
-    for i in range(0, len(words), batch_size):
-        batch = words[i:i + batch_size]
-        words_str = ", ".join(batch)
+    with ThreadPoolExecutor(max_workers=WORD_ANALYSIS_WORKERS, thread_name_prefix="word-analysis") as pool:
+        futures = [pool.submit(_analyze_word_batch, batch, model) for batch in batches]
 
-        prompt = f"Analyze these Spanish words: {words_str}"
+        # Report progress as batches complete, not as they are submitted
+        for batch_num, _ in enumerate(as_completed(futures), 1):
+            if progress_callback:
+                progress_callback(batch_num, total_batches, f"Analyzed batch {batch_num} of {total_batches}")
 
-        try:
-            response = chat(prompt, mode="word_analysis", model=model)
-
-            # Try to parse JSON from response
-            # Handle case where LLM might include extra text
-            json_start = response.find('{')
-            json_end = response.rfind('}') + 1
-
-            if json_start >= 0 and json_end > json_start:
-                json_str = response[json_start:json_end]
-
-                # Handle potential encoding issues by ensuring proper UTF-8
-                # This fixes issues where accented characters may be corrupted
-                try:
-                    # Normalize unicode characters to ensure consistency
-                    json_str = unicodedata.normalize('NFC', json_str)
-                    data = json.loads(json_str)
-                    all_results.extend(data.get('words', []))
-                except (json.JSONDecodeError, UnicodeDecodeError) as parse_error:
-                    # If JSON parsing fails, try to extract word data using simpler fallback
-                    # This handles cases where encoding corruption makes JSON invalid
-                    print(f"Warning: JSON parse error, attempting fallback translation lookup")
-                    print(f"  Error: {parse_error}")
-
-                    # Use frequency_data as fallback for translations
-                    from src.frequency_data import get_translation, get_frequency_rank
-                    from src.content_analysis import lemmatize_spanish
-
-                    for word in batch:
-                        base = word.lower().strip()
-                        translation = get_translation(base)
-                        base_form = base
-
-                        # If no translation in frequency data, try lemmatization
-                        if not translation:
-                            lemma = lemmatize_spanish(base)
-                            if lemma != base:
-                                base_form = lemma
-                                translation = get_translation(lemma)
-
-                        all_results.append({
-                            'spanish': word,
-                            'base_form': base_form,
-                            'english': translation,
-                            'pos': 'unknown',
-                            'skip': False
-                        })
-            else:
-                print(f"Warning: Could not find JSON in LLM response for batch")
-                print(f"  Response preview: {response[:200]}...")
-                print(f"  Using fast fallback to frequency_data instead of individual retries")
-                # When batch fails, use frequency_data fallback immediately
-                # This is much faster than individual LLM retries (seconds vs minutes)
-                from src.frequency_data import get_translation
-                from src.content_analysis import lemmatize_spanish
-                for word in batch:
-                    try:
-                        # Retry this single word
-                        single_response = chat(f"Analyze this Spanish word: {word}", mode="word_analysis", model=model)
-                        single_json_start = single_response.find('{')
-                        single_json_end = single_response.rfind('}') + 1
-
-                        if single_json_start >= 0 and single_json_end > single_json_start:
-                            single_json_str = single_response[single_json_start:single_json_end]
-                            single_json_str = unicodedata.normalize('NFC', single_json_str)
-                            single_data = json.loads(single_json_str)
-                            word_results = single_data.get('words', [])
-                            if word_results:
-                                all_results.extend(word_results)
-                                continue
-                    except Exception as retry_error:
-                        print(f"  Individual retry failed for '{word}': {retry_error}")
-
-                    # If individual retry also failed, use frequency_data fallback
-                    from src.frequency_data import get_translation
-                    from src.content_analysis import lemmatize_spanish
-                    base = word.lower().strip()
-                    translation = get_translation(base)
-                    base_form = base
-                    if not translation:
-                        lemma = lemmatize_spanish(base)
-                        if lemma != base:
-                            base_form = lemma
-                            translation = get_translation(lemma)
-                    all_results.append({
-                        'spanish': word,
-                        'base_form': base_form,
-                        'english': translation,
-                        'pos': 'unknown',
-                        'skip': False
-                    })
-
-        except json.JSONDecodeError as e:
-            print(f"Warning: JSON decode error in word analysis: {e}")
-            # Fallback to frequency_data with lemmatization
-            from src.frequency_data import get_translation
-            from src.content_analysis import lemmatize_spanish
-            for word in batch:
-                base = word.lower().strip()
-                translation = get_translation(base)
-                base_form = base
-                if not translation:
-                    lemma = lemmatize_spanish(base)
-                    if lemma != base:
-                        base_form = lemma
-                        translation = get_translation(lemma)
-                all_results.append({
-                    'spanish': word,
-                    'base_form': base_form,
-                    'english': translation,
-                    'pos': 'unknown',
-                    'skip': False
-                })
-        except Exception as e:
-            print(f"Error in word analysis: {e}")
-            # Fallback to frequency_data with lemmatization
-            from src.frequency_data import get_translation
-            from src.content_analysis import lemmatize_spanish
-            for word in batch:
-                base = word.lower().strip()
-                translation = get_translation(base)
-                base_form = base
-                if not translation:
-                    lemma = lemmatize_spanish(base)
-                    if lemma != base:
-                        base_form = lemma
-                        translation = get_translation(lemma)
-                all_results.append({
-                    'spanish': word,
-                    'base_form': base_form,
-                    'english': translation,
-                    'pos': 'unknown',
-                    'skip': False
-                })
-
-        # Report progress after each batch
-        if progress_callback:
-            batch_num = (i // batch_size) + 1
-            progress_callback(batch_num, total_batches, f"Analyzing batch {batch_num} of {total_batches}")
-
-    return all_results
+    return [result for future in futures for result in future.result()]
 
 
 if __name__ == "__main__":